@@ -26,6 +26,7 @@ class ChatClient:
         self.connection_status_changed = self.core.signals.connection_status_changed
         self.file_transfer_request = self.core.signals.file_transfer_request
         self.file_transfer_progress = self.core.signals.file_transfer_progress
+        self.file_transfer_progress_batch = self.core.signals.file_transfer_progress_batch
         self.file_transfer_complete = self.core.signals.file_transfer_complete
         self.file_list_received = self.core.signals.file_list_received
     
@@ -4,7 +4,9 @@ Core client functionality for connection and authentication.
 
 import socket
 import threading
+import time
 import logging
+from collections import deque
 from typing import Optional
 from .client_signals import ClientSignals
 
@@ -28,6 +30,9 @@ except ImportError:
 class ClientCore:
     """Core client functionality for connection and basic operations."""
     
+    # Minimum seconds between file transfer progress batches
+    PROGRESS_FLUSH_INTERVAL = 0.05
+    
     def __init__(self, server_host: str = 'localhost', server_port: int = 8888):
         self.server_host = server_host
         self.server_port = server_port
@@ -48,6 +53,14 @@ class ClientCore:
         
         # Initialize signals
         self.signals = ClientSignals()
+        
+        # File transfer progress is queued here and emitted in batches
+        self._progress_updates = deque()
+        self._progress_lock = threading.Lock()
+        self._progress_emit_lock = threading.RLock()  # Keeps batches from concurrent flushes in order
+        self._progress_last_flush = 0.0
+        self._progress_pending = threading.Event()  # Set while updates wait for the flusher
+        self._progress_flusher: Optional[threading.Thread] = None  # Started with the first update
     
     def connect(self, username: str) -> bool:
         """Connect to the server."""
@@ -92,6 +105,7 @@ class ClientCore:
         """Disconnect from the server."""
         self.intentional_disconnect = intentional
         self.connected = False
+        self.flush_file_transfer_progress()
         
         if self.connection_manager:
             disconnect_message = Message(MessageType.DISCONNECT, {})
@@ -122,11 +136,58 @@ class ClientCore:
                 break
         
         self.connected = False
+        self.flush_file_transfer_progress()
         self.signals.connection_status_changed.emit(False)
         
         if not self.intentional_disconnect:
             self.signals.error_occurred.emit("Connection lost")
     
+    def report_file_transfer_progress(self, transfer_id: str, current: int, total: int):
+        """Queue a progress update; queued updates are emitted every 50 ms."""
+        with self._progress_lock:
+            self._progress_updates.append((transfer_id, current, total))
+            due = current >= total or time.monotonic() - self._progress_last_flush >= self.PROGRESS_FLUSH_INTERVAL
+            if not due:
+                # The flusher emits it on time even if no further update arrives
+                self._progress_pending.set()
+                if self._progress_flusher is None:
+                    self._progress_flusher = threading.Thread(
+                        target=self._progress_flush_loop, name="progress-flusher", daemon=True
+                    )
+                    self._progress_flusher.start()
+        
+        if due:
+            self.flush_file_transfer_progress()
+    
+    def _progress_flush_loop(self):
+        """Flush queued progress updates at most 50 ms after they were queued."""
+        while True:
+            self._progress_pending.wait()  # Idle until an update is queued
+            with self._progress_lock:
+                wait = self.PROGRESS_FLUSH_INTERVAL - (time.monotonic() - self._progress_last_flush)
+            if wait > 0:
+                time.sleep(wait)
+            self.flush_file_transfer_progress()
+    
+    def flush_file_transfer_progress(self):
+        """Emit all queued progress updates as one batch."""
+        with self._progress_emit_lock:
+            with self._progress_lock:
+                self._progress_pending.clear()
+                self._progress_last_flush = time.monotonic()
+                updates = []
+                while self._progress_updates:
+                    updates.append(self._progress_updates.popleft())
+            if not updates:
+                return
+            
+            self.signals.file_transfer_progress_batch.emit(updates)
+            
+            # Per-transfer listeners only see the latest update of each batch
+            latest = {transfer_id: (current, total) for transfer_id, current, total in updates}
+            for transfer_id, (current, total) in latest.items():
+                self.signals.file_transfer_progress.emit(transfer_id, current, total)
+    
     def send_message(self, message) -> bool:
         """Send a message to the server."""
         if not self.connected or not self.connection_manager:
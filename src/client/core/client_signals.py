@@ -15,5 +15,6 @@ class ClientSignals(QObject):
     connection_status_changed = pyqtSignal(bool)  # Connected status
     file_transfer_request = pyqtSignal(object)  # FileTransferRequest object
     file_transfer_progress = pyqtSignal(str, int, int)  # transfer_id, current, total
+    file_transfer_progress_batch = pyqtSignal(list)  # List of (transfer_id, current, total)
     file_transfer_complete = pyqtSignal(str, bool, str)  # transfer_id, success, file_path
     file_list_received = pyqtSignal(list)  # List of file info dictionaries
\ No newline at end of file
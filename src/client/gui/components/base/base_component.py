@@ -213,11 +213,7 @@ class BaseComponent(QWidget):
         if data is None:
             data = {}
         
-        event = Event(
-            event_type=event_type,
-            data=data,
-            source=self.component_id
-        )
+        event = Event.make(event_type, data, self.component_id)
         
         self.event_bus.publish(event)
     
@@ -232,11 +228,7 @@ class BaseComponent(QWidget):
         if data is None:
             data = {}
         
-        event = Event(
-            event_type=event_type,
-            data=data,
-            source=self.component_id
-        )
+        event = Event.make(event_type, data, self.component_id)
         
         self.event_bus.publish_async(event)
     
@@ -44,6 +44,20 @@ class ComponentRegistry:
         self._component_types[component_type] = component_class
         logger.debug(f"Registered component type: {component_type}")
     
+    def register_component_types(self, component_types: Dict[str, Type[BaseComponent]]) -> None:
+        """
+        Register several component types at once.
+        
+        Args:
+            component_types: Mapping of type identifier to component class
+        """
+        for component_type, component_class in component_types.items():
+            if not issubclass(component_class, BaseComponent):
+                raise ValueError(f"Component class must inherit from BaseComponent")
+        
+        self._component_types.update(component_types)
+        logger.debug(f"Registered component types: {list(component_types)}")
+    
     def create_component(self, component_id: str, component_type: str, 
                         parent: QWidget = None, **kwargs) -> BaseComponent:
         """
@@ -214,6 +228,18 @@ class ComponentRegistry:
         self._component_dependencies[component_id] = dependencies.copy()
         logger.debug(f"Set dependencies for {component_id}: {dependencies}")
     
+    def set_many_dependencies(self, dependencies: Dict[str, List[str]]) -> None:
+        """
+        Set dependencies for several components at once.
+        
+        Args:
+            dependencies: Mapping of component ID to the component IDs it depends on
+        """
+        self._component_dependencies.update(
+            (component_id, list(deps)) for component_id, deps in dependencies.items()
+        )
+        logger.debug(f"Set dependencies for {len(dependencies)} components")
+    
     def get_component_dependencies(self, component_id: str) -> List[str]:
         """
         Get dependencies for a component.
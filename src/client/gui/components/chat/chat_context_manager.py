@@ -37,6 +37,10 @@ class ChatContextManager(BaseComponent):
         self._contexts: Dict[str, ChatContext] = {}
         self._current_context_id: Optional[str] = None
         
+        # Histories are rebuilt from fresh message list copies on every change,
+        # so the state can share them instead of cloning every message
+        state_manager.register_cow(StateKeys.CHAT_HISTORIES)
+        
         # Initialize with common chat context
         self._create_common_chat_context()
     
@@ -48,7 +52,7 @@ class ChatContextManager(BaseComponent):
         """Set up event handlers."""
         self.subscribe_to_event(ChatEvents.USER_SELECTED, self._handle_user_selected)
         self.subscribe_to_event(ChatEvents.COMMON_CHAT_SELECTED, self._handle_common_chat_selected)
-        self.subscribe_to_event(ChatEvents.MESSAGE_RECEIVED, self._handle_message_received)
+        self.subscribe_to_event(ChatEvents.MESSAGE_RECEIVED_BATCH, self._handle_message_batch_received)
         self.subscribe_to_event(ChatEvents.MESSAGE_SENT, self._handle_message_sent)
     
     def setup_state_subscriptions(self) -> None:
@@ -204,6 +208,21 @@ class ChatContextManager(BaseComponent):
         Returns:
             True if successful, False otherwise
         """
+        if not self._append_message(context_id, message):
+            return False
+        
+        # Update chat histories state so ChatDisplay can show the messages
+        self._update_chat_histories_state()
+        
+        # Update state if this is the current context
+        if context_id == self._current_context_id:
+            # Update context list
+            self.set_state(StateKeys.CHAT_CONTEXTS, self.get_context_list())
+        
+        return True
+    
+    def _append_message(self, context_id: str, message: Dict[str, Any]) -> bool:
+        """Add a message to a context without publishing the updated state."""
         if context_id not in self._contexts:
             logger.error(f"Context not found: {context_id}")
             return False
@@ -216,14 +235,6 @@ class ChatContextManager(BaseComponent):
         if len(context.messages) > 1000:
             context.messages = context.messages[-1000:]
         
-        # Update chat histories state so ChatDisplay can show the messages
-        self._update_chat_histories_state()
-        
-        # Update state if this is the current context
-        if context_id == self._current_context_id:
-            # Update context list
-            self.set_state(StateKeys.CHAT_CONTEXTS, self.get_context_list())
-        
         logger.info(f"✅ ChatContextManager: Added message to context {context_id}")
         return True
     
@@ -339,13 +350,33 @@ class ChatContextManager(BaseComponent):
         logger.info("Handling common chat selection")
         self.switch_to_context("common")
     
-    def _handle_message_received(self, event: Event) -> None:
-        """Handle received message."""
-        message = event.data.get("message")
-        if not message:
-            logger.debug("ChatContextManager: No message data in event")
+    def _handle_message_batch_received(self, event: Event) -> None:
+        """Handle a batch of received messages with one state update."""
+        updated_contexts = set()
+        for message in event.data.get("messages") or ():
+            if message:
+                context_id = self._route_received_message(message)
+                if context_id:
+                    updated_contexts.add(context_id)
+        
+        if not updated_contexts:
             return
         
+        # Publish the histories once for the whole batch
+        self._update_chat_histories_state()
+        
+        if self._current_context_id in updated_contexts:
+            self.set_state(StateKeys.CHAT_CONTEXTS, self.get_context_list())
+    
+    def _route_received_message(self, message: Dict[str, Any]) -> Optional[str]:
+        """
+        Add a received message to the context it belongs to.
+        
+        The chat histories state is not updated; the caller publishes it.
+        
+        Returns:
+            ID of the context the message was added to, or None
+        """
         # Determine which context this message belongs to
         message_type = message.get("message_type", "public")
         is_private = message.get("is_private", False)
@@ -371,16 +402,17 @@ class ChatContextManager(BaseComponent):
                     logger.debug(f"ChatContextManager: Created new private context with {sender}: {context_id}")
             else:
                 logger.warning(f"ChatContextManager: Cannot route private message: invalid sender {sender} or self-message")
-                return
+                return None
         
         if context_id:
-            success = self.add_message_to_context(context_id, message)
+            success = self._append_message(context_id, message)
             if success:
                 logger.debug(f"ChatContextManager: Successfully added {message_type} message from {sender} to context: {context_id}")
-            else:
-                logger.error(f"ChatContextManager: Failed to add message to context: {context_id}")
+                return context_id
+            logger.error(f"ChatContextManager: Failed to add message to context: {context_id}")
         else:
             logger.error(f"ChatContextManager: No context determined for {message_type} message from {sender}")
+        return None
     
     def _handle_message_sent(self, event: Event) -> None:
         """Handle sent message."""
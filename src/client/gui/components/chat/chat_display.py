@@ -50,7 +50,7 @@ class ChatDisplay(BaseComponent):
     def setup_event_handlers(self) -> None:
         """Set up event handlers."""
         self.subscribe_to_event(
-            ChatEvents.MESSAGE_RECEIVED, self._handle_message_received)
+            ChatEvents.MESSAGE_RECEIVED_BATCH, self._handle_message_batch_received)
         self.subscribe_to_event(ChatEvents.MESSAGE_SENT,
                                 self._handle_message_sent)
         self.subscribe_to_event(
@@ -76,13 +76,22 @@ class ChatDisplay(BaseComponent):
         
         logger.info("Chat display component initialized")
 
-    def _handle_message_received(self, event: Event) -> None:
-        """Handle received message."""
-        message = event.data.get("message")
-        if not message:
-            logger.debug("ChatDisplay: No message data in event")
+    def _handle_message_batch_received(self, event: Event) -> None:
+        """Handle a batch of received messages with a single repaint."""
+        messages = event.data.get("messages")
+        if not messages or not self.message_display:
             return
 
+        self.message_display.setUpdatesEnabled(False)
+        try:
+            for message in messages:
+                if message:
+                    self._show_received_message(message)
+        finally:
+            self.message_display.setUpdatesEnabled(True)
+
+    def _show_received_message(self, message: Dict[str, Any]) -> None:
+        """Display a received message if it belongs to the current context."""
         # Only display if it's for the current context
         current_context = self.get_state(StateKeys.CURRENT_CHAT_CONTEXT)
         if not current_context:
@@ -298,7 +307,7 @@ class ChatDisplay(BaseComponent):
 
         elif change.key == StateKeys.CHAT_HISTORIES:
             # Message history updated - don't reload all messages to prevent duplicates
-            # Messages are already displayed when received via _handle_message_received
+            # Messages are already displayed when received via _handle_message_batch_received
             logger.info(
                 f"📺 ChatDisplay: Chat histories updated with {len(change.new_value)} contexts, but not reloading to prevent duplicates")
 
@@ -16,6 +16,10 @@ from ..base.base_component import BaseComponent
 
 logger = logging.getLogger(__name__)
 
+# File size limit for outgoing transfers (10MB)
+_MAX_FILE_SIZE = 10 * 1024 * 1024
+_MAX_FILE_SIZE_MSG = "File too large. Maximum size is 10MB"
+
 
 class FileTransferInput(BaseComponent):
     """File transfer input component for sending files."""
@@ -29,6 +33,7 @@ class FileTransferInput(BaseComponent):
 
         self.file_button = None
         self.current_context_id = None
+        self._last_enabled: Optional[bool] = None
 
     def setup_ui(self) -> None:
         """Set up the file transfer input UI."""
@@ -47,14 +52,11 @@ class FileTransferInput(BaseComponent):
         """Set up event handlers."""
         self.subscribe_to_event(
             ChatEvents.CONTEXT_SWITCHED, self._handle_context_switched)
-        self.subscribe_to_event(
-            ChatEvents.USER_LIST_UPDATED, self._handle_user_list_updated)
 
     def setup_state_subscriptions(self) -> None:
         """Set up state subscriptions."""
         self.subscribe_to_state(StateKeys.CURRENT_CHAT_CONTEXT)
         self.subscribe_to_state(StateKeys.CURRENT_USER)
-        self.subscribe_to_state(StateKeys.USER_LIST)
         self.subscribe_to_state(StateKeys.CONNECTION_STATUS)
 
     def on_initialize(self) -> None:
@@ -95,21 +97,22 @@ class FileTransferInput(BaseComponent):
         if not file_path:
             return  # User cancelled
 
-        # Check if file exists and get file info
-        if not os.path.exists(file_path):
-            QMessageBox.warning(self, "Error", "Selected file does not exist")
+        filename = os.path.basename(file_path)
+
+        # Get file info; a single stat also covers the file having vanished
+        try:
+            file_size = os.stat(file_path).st_size
+        except (FileNotFoundError, PermissionError) as e:
+            QMessageBox.warning(self, "Error", f"Cannot access file: {e}")
             return
 
-        file_size = os.path.getsize(file_path)
         if file_size == 0:
             QMessageBox.warning(self, "Error", "Cannot send empty file")
             return
 
-        # Check file size limit (10MB)
-        max_size = 10 * 1024 * 1024  # 10MB
-        if file_size > max_size:
-            QMessageBox.warning(
-                self, "Error", f"File too large. Maximum size is {max_size // (1024*1024)}MB")
+        # Check file size limit
+        if file_size > _MAX_FILE_SIZE:
+            QMessageBox.warning(self, "Error", _MAX_FILE_SIZE_MSG)
             return
 
         # Determine recipient based on context
@@ -135,7 +138,7 @@ class FileTransferInput(BaseComponent):
         # Create file transfer request data
         file_data = {
             "file_path": file_path,
-            "filename": os.path.basename(file_path),
+            "filename": filename,
             "file_size": file_size,
             "sender": current_user,
             "recipient": recipient,
@@ -153,7 +156,7 @@ class FileTransferInput(BaseComponent):
         self.file_transfer_requested.emit(file_data)
 
         logger.debug(
-            f"FileTransferInput: Requested {('private' if is_private else 'public')} file transfer: {os.path.basename(file_path)} (context: {current_context})")
+            f"FileTransferInput: Requested {('private' if is_private else 'public')} file transfer: {filename} (context: {current_context})")
 
     def _get_other_participant(self, context_id: str) -> Optional[str]:
         """Get the other participant in a private context."""
@@ -176,11 +179,6 @@ class FileTransferInput(BaseComponent):
         if new_context_id:
             self._switch_to_context(new_context_id)
 
-    def _handle_user_list_updated(self, event: Event) -> None:
-        """Handle user list updates."""
-        # Could be used to update recipient options in the future
-        pass
-
     def _switch_to_context(self, context_id: str) -> None:
         """Switch to a different context."""
         if context_id == self.current_context_id:
@@ -212,10 +210,15 @@ class FileTransferInput(BaseComponent):
 
     def _update_connection_status(self) -> None:
         """Update UI based on connection status."""
-        connection_status = self.get_state(StateKeys.CONNECTION_STATUS, False)
+        if not self.file_button:
+            return
 
-        if self.file_button:
-            self.file_button.setEnabled(connection_status)
+        connection_status = bool(self.get_state(StateKeys.CONNECTION_STATUS, False))
+        if connection_status == self._last_enabled:
+            return
+        self._last_enabled = connection_status
+
+        self.file_button.setEnabled(connection_status)
 
     def on_state_change(self, change) -> None:
         """Handle state changes."""
@@ -225,14 +228,6 @@ class FileTransferInput(BaseComponent):
             if new_context and new_context != self.current_context_id:
                 self._switch_to_context(new_context)
 
-        elif change.key == StateKeys.USER_LIST:
-            # User list updated
-            self._handle_user_list_updated(Event(
-                event_type=ChatEvents.USER_LIST_UPDATED,
-                data={"users": change.new_value or []},
-                source="state_manager"
-            ))
-
         elif change.key == StateKeys.CONNECTION_STATUS:
             # Connection status changed
             self._update_connection_status()
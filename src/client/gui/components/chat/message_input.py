@@ -8,8 +8,6 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QHBoxLayout,
-    QComboBox,
-    QLabel,
     QWidget,
 )
 from PySide6.QtCore import Qt, Signal
@@ -36,69 +34,43 @@ class MessageInput(BaseComponent):
 
         self.message_input = None
         self.send_button = None
-        self.message_type_combo = None
-        self.recipient_combo = None
+        self.emoji_button = None
         self.current_context_id = None
+        self._last_enabled: Optional[bool] = None
 
     def setup_ui(self) -> None:
         """Set up the message input UI."""
+        # Single flat layout: message type and recipient are determined by
+        # the current context, so no selector widgets are needed.
         layout = QHBoxLayout(self)
 
-        # Message type selection (for future use - currently context determines type)
-        message_type_layout = QHBoxLayout()
-        message_type_layout.addWidget(QLabel("Type:"))
-
-        self.message_type_combo = QComboBox()
-        # Auto-detect based on context
-        self.message_type_combo.addItems(["Auto"])
-        self.message_type_combo.setEnabled(False)  # Disabled for now
-        message_type_layout.addWidget(self.message_type_combo)
-
-        # Recipient selection (hidden for now, context determines recipient)
-        message_type_layout.addWidget(QLabel("To:"))
-        self.recipient_combo = QComboBox()
-        self.recipient_combo.setVisible(False)  # Hidden for now
-        message_type_layout.addWidget(self.recipient_combo)
-
-        message_type_layout.addStretch()
-        layout.addLayout(message_type_layout)
-
-        # Input area
-        input_layout = QHBoxLayout()
-
         # Message input field
         self.message_input = QLineEdit()
         self.message_input.setPlaceholderText("Type your message here...")
         self.message_input.setFont(QFont("Consolas", 10))
         self.message_input.returnPressed.connect(self._send_message)
-        input_layout.addWidget(self.message_input)
+        layout.addWidget(self.message_input)
 
         # Send button
         self.send_button = QPushButton("Send")
         self.send_button.clicked.connect(self._send_message)
-        input_layout.addWidget(self.send_button)
-
-        layout.addLayout(input_layout)
+        layout.addWidget(self.send_button)
 
         # Add Emoji button next to send button
         self.emoji_button = QPushButton("😊")
         self.emoji_button.clicked.connect(self._open_emoji_picker)
-        input_layout.addWidget(self.emoji_button)
+        layout.addWidget(self.emoji_button)
 
     def setup_event_handlers(self) -> None:
         """Set up event handlers."""
         self.subscribe_to_event(
             ChatEvents.CONTEXT_SWITCHED, self._handle_context_switched
         )
-        self.subscribe_to_event(
-            ChatEvents.USER_LIST_UPDATED, self._handle_user_list_updated
-        )
 
     def setup_state_subscriptions(self) -> None:
         """Set up state subscriptions."""
         self.subscribe_to_state(StateKeys.CURRENT_CHAT_CONTEXT)
         self.subscribe_to_state(StateKeys.CURRENT_USER)
-        self.subscribe_to_state(StateKeys.USER_LIST)
         self.subscribe_to_state(StateKeys.CONNECTION_STATUS)
 
     def on_initialize(self) -> None:
@@ -206,11 +178,6 @@ class MessageInput(BaseComponent):
         if new_context_id:
             self._switch_to_context(new_context_id)
 
-    def _handle_user_list_updated(self, event: Event) -> None:
-        """Handle user list updates."""
-        users = event.data.get("users", [])
-        self._update_recipient_combo(users)
-
     def _switch_to_context(self, context_id: str) -> None:
         """Switch to a different context."""
         if context_id == self.current_context_id:
@@ -223,12 +190,14 @@ class MessageInput(BaseComponent):
 
     def _update_ui_for_context(self) -> None:
         """Update UI based on current context."""
+        if self.message_input is None:
+            return
+
         current_context = self.get_state(StateKeys.CURRENT_CHAT_CONTEXT)
 
         if current_context == "common":
             # Public chat
             self.message_input.setPlaceholderText("Type your message here...")
-            self.recipient_combo.setVisible(False)
         else:
             # Private chat
             other_user = self._get_other_participant(current_context)
@@ -240,29 +209,19 @@ class MessageInput(BaseComponent):
                 self.message_input.setPlaceholderText(
                     "Type your private message here..."
                 )
-            self.recipient_combo.setVisible(False)  # Hidden for now
 
-    def _update_recipient_combo(self, users: list) -> None:
-        """Update recipient combo box with available users."""
-        if not self.recipient_combo:
+    def _update_connection_status(self) -> None:
+        """Update UI based on connection status."""
+        if not (self.send_button and self.message_input):
             return
 
-        current_user = self.get_state(StateKeys.CURRENT_USER)
-        if not current_user:
+        connection_status = bool(self.get_state(StateKeys.CONNECTION_STATUS, False))
+        if connection_status == self._last_enabled:
             return
+        self._last_enabled = connection_status
 
-        # Clear and populate with other users
-        self.recipient_combo.clear()
-        other_users = [user for user in users if user != current_user]
-        self.recipient_combo.addItems(other_users)
-
-    def _update_connection_status(self) -> None:
-        """Update UI based on connection status."""
-        connection_status = self.get_state(StateKeys.CONNECTION_STATUS, False)
-
-        if self.send_button and self.message_input:
-            self.send_button.setEnabled(connection_status)
-            self.message_input.setEnabled(connection_status)
+        self.send_button.setEnabled(connection_status)
+        self.message_input.setEnabled(connection_status)
 
     def on_state_change(self, change) -> None:
         """Handle state changes."""
@@ -272,11 +231,6 @@ class MessageInput(BaseComponent):
             if new_context and new_context != self.current_context_id:
                 self._switch_to_context(new_context)
 
-        elif change.key == StateKeys.USER_LIST:
-            # User list updated
-            users = change.new_value or []
-            self._update_recipient_combo(users)
-
         elif change.key == StateKeys.CONNECTION_STATUS:
             # Connection status changed
             self._update_connection_status()
@@ -3,37 +3,104 @@ File transfer dialog component.
 """
 
 import logging
+from collections import deque
+from typing import Callable, Optional
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QMessageBox
 
 logger = logging.getLogger(__name__)
 
 class FileTransferDialog(QDialog):
     """Dialog for accepting/declining file transfers."""
-    
-    def __init__(self, filename: str, sender: str, file_size: str = None, parent=None):
+
+    def __init__(self, filename: str = "", sender: str = "", file_size: str = None, parent=None):
         super().__init__(parent)
-        
+
         self.setWindowTitle("File Transfer Request")
         self.setModal(True)
-        
+
         layout = QVBoxLayout(self)
-        
+
         # Message
-        size_text = f" ({file_size})" if file_size else ""
-        message = QLabel(f"User '{sender}' wants to send you the file:\n\n{filename}{size_text}\n\nAccept the file?")
-        layout.addWidget(message)
-        
+        self._message_label = QLabel()
+        layout.addWidget(self._message_label)
+
         # Buttons
         button_layout = QHBoxLayout()
-        
+
         accept_button = QPushButton("Accept")
         accept_button.clicked.connect(self.accept)
         button_layout.addWidget(accept_button)
-        
+
         decline_button = QPushButton("Decline")
         decline_button.clicked.connect(self.reject)
         button_layout.addWidget(decline_button)
-        
+
         layout.addLayout(button_layout)
-        
-        logger.debug(f"Created file transfer dialog for {filename} from {sender}")
\ No newline at end of file
+
+        self.set_request(filename, sender, file_size)
+
+        # Answers for requests queued through ask()
+        self.finished.connect(self._on_finished)
+
+    def set_request(self, filename: str, sender: str, file_size: str = None) -> None:
+        """Update the dialog text for a new file transfer request."""
+        size_text = f" ({file_size})" if file_size else ""
+        self._message_label.setText(
+            f"User '{sender}' wants to send you the file:\n\n{filename}{size_text}\n\nAccept the file?"
+        )
+
+        logger.debug(f"Prepared file transfer dialog for {filename} from {sender}")
+
+    @classmethod
+    def prewarm(cls, parent=None) -> "FileTransferDialog":
+        """Build the shared hidden dialog ahead of the first request."""
+        global _dialog_singleton
+        if _dialog_singleton is None:
+            _dialog_singleton = cls(parent=parent)
+            _dialog_singleton.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, False)
+            _dialog_singleton.ensurePolished()
+        return _dialog_singleton
+
+    @classmethod
+    def ask(cls, filename: str, sender: str, file_size: str = None,
+            on_answer: Callable[[bool], None] = None, parent=None) -> None:
+        """
+        Ask the user to accept a file transfer without blocking the event loop.
+
+        Requests that arrive while the dialog is open are shown one after another.
+
+        Args:
+            on_answer: Called with True if the user accepted, False otherwise
+        """
+        dialog = cls.prewarm(parent)
+        _pending_requests.append((filename, sender, file_size, on_answer))
+        if not dialog.isVisible() and len(_pending_requests) == 1:
+            dialog._show_next_request()
+
+    def _show_next_request(self) -> None:
+        """Show the oldest queued request, if any."""
+        if _pending_requests:
+            filename, sender, file_size, _ = _pending_requests[0]
+            self.set_request(filename, sender, file_size)
+            self.open()
+
+    def _on_finished(self, result: int) -> None:
+        """Deliver the answer for the shown request and move on to the next one."""
+        if not _pending_requests:
+            return
+
+        *_, on_answer = _pending_requests.popleft()
+        if on_answer is not None:
+            on_answer(result == QDialog.DialogCode.Accepted)
+
+        # Reopen from the event loop rather than inside the finished emission
+        if _pending_requests:
+            QTimer.singleShot(0, self._show_next_request)
+
+
+# Shared instance reused for every incoming request
+_dialog_singleton: Optional[FileTransferDialog] = None
+
+# Requests waiting for an answer through ask(); the first one is on screen
+_pending_requests = deque()
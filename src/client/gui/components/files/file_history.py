@@ -5,11 +5,17 @@ File history component for viewing and managing received files.
 from typing import Dict, Any, Optional, List
 import logging
 import os
+import platform
+import shutil
+import subprocess
+import time
 from datetime import datetime
-from PySide6.QtWidgets import (QListWidget, QListWidgetItem, QVBoxLayout, 
+from operator import itemgetter
+from PySide6.QtWidgets import (QListView, QAbstractItemView, QVBoxLayout, 
                               QLabel, QWidget, QPushButton, QHBoxLayout,
                               QMessageBox, QFileDialog)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (Qt, Signal, QObject, QRunnable, QThreadPool,
+                            QAbstractListModel, QModelIndex)
 from PySide6.QtGui import QFont, QIcon
 
 from ...core.event_bus import EventBus, Event, ChatEvents
@@ -18,6 +24,201 @@ from ..base.base_component import BaseComponent
 
 logger = logging.getLogger(__name__)
 
+# Model role holding the cached (exists, mtime, checked_at) stat result
+_EXISTS_ROLE = Qt.ItemDataRole.UserRole + 1
+# Model role holding the file's on-disk basename
+_BASENAME_ROLE = Qt.ItemDataRole.UserRole + 2
+# Seconds a cached existence check is trusted before stat-ing again
+_EXISTS_CACHE_TTL = 60.0
+# Buffer size for Save As copies
+_COPY_BUFFER_SIZE = 1 << 20
+
+# Sort key for file entries; timestamps are normalized on ingest
+_by_timestamp = itemgetter('timestamp')
+
+# Platform checks for opening files, resolved once at import
+_IS_WINDOWS = platform.system() == 'Windows'
+_IS_DARWIN = platform.system() == 'Darwin'
+
+
+def _stat_entry(file_path: str) -> tuple:
+    """Stat a file once and return an (exists, mtime, checked_at) entry."""
+    try:
+        mtime = os.stat(file_path).st_mtime
+        return (True, mtime, time.monotonic())
+    except OSError:
+        return (False, None, time.monotonic())
+
+
+def _copy_file_contents(src, dst) -> None:
+    """Copy between open files in-kernel when possible, else with a buffered loop."""
+    remaining = os.fstat(src.fileno()).st_size
+    try:
+        while remaining > 0:
+            copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+    except (AttributeError, OSError):
+        # Not available on this platform/filesystem; fall back from the current offsets
+        shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+        return
+    
+    if remaining > 0:
+        # Source shorter than reported or kernel stopped early; finish in userspace
+        shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+
+
+class _FileStatSignals(QObject):
+    """Signals for reporting stat results from the worker thread."""
+    
+    finished = Signal(int, object)  # generation, {file_path: entry}
+
+
+class _FileStatWorker(QRunnable):
+    """Stat a batch of files with one directory scan per parent directory."""
+    
+    def __init__(self, generation: int, file_paths: List[str]):
+        super().__init__()
+        self.generation = generation
+        self.file_paths = file_paths
+        self.signals = _FileStatSignals()
+    
+    def run(self) -> None:
+        """Scan each parent directory once and collect stat entries."""
+        # Group by normalized path so "./a", "dir//a" and "dir/" spellings still
+        # match the scan; results stay keyed by the path as listed.
+        by_dir: Dict[str, Dict[str, List[str]]] = {}
+        for file_path in self.file_paths:
+            normalized = os.path.normpath(file_path)
+            wanted = by_dir.setdefault(os.path.dirname(normalized), {})
+            wanted.setdefault(normalized, []).append(file_path)
+        
+        results: Dict[str, tuple] = {}
+        for directory, wanted in by_dir.items():
+            try:
+                with os.scandir(directory or ".") as entries:
+                    for entry in entries:
+                        originals = wanted.get(os.path.join(directory, entry.name))
+                        if originals:
+                            try:
+                                stat_result = (True, entry.stat().st_mtime, time.monotonic())
+                            except OSError:
+                                continue
+                            for file_path in originals:
+                                results[file_path] = stat_result
+            except OSError:
+                pass
+            
+            # Anything not seen in the listing is missing or unreadable
+            for originals in wanted.values():
+                for file_path in originals:
+                    if file_path not in results:
+                        results[file_path] = (False, None, time.monotonic())
+        
+        self.signals.finished.emit(self.generation, results)
+
+
+class _FileCopySignals(QObject):
+    """Signals for reporting Save As copies from the worker thread."""
+    
+    copy_finished = Signal(str, str, str)  # file_path, new_path, error ("" on success)
+
+
+class _FileCopyWorker(QRunnable):
+    """Copy a file to a new location on a pool thread."""
+    
+    def __init__(self, file_path: str, new_path: str):
+        super().__init__()
+        self.file_path = file_path
+        self.new_path = new_path
+        self.signals = _FileCopySignals()
+    
+    def run(self) -> None:
+        """Copy the file contents and report the outcome."""
+        error = ""
+        try:
+            with open(self.file_path, 'rb') as src, open(self.new_path, 'wb') as dst:
+                _copy_file_contents(src, dst)
+            shutil.copystat(self.file_path, self.new_path)
+        except OSError as e:
+            error = str(e)
+        self.signals.copy_finished.emit(self.file_path, self.new_path, error)
+
+
+class _FileListModel(QAbstractListModel):
+    """List model that renders rows straight from the file info dictionaries."""
+    
+    _TT_PUBLIC = "Public file from {}\nReceived: {}\nPath: {}"
+    _TT_PRIVATE = "Private file from {}\nReceived: {}\nPath: {}"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._files: List[Dict[str, Any]] = []
+        self._stat_cache: Dict[str, tuple] = {}  # file_path -> (exists, mtime, checked_at)
+        self._basenames: Dict[str, str] = {}  # file_path -> basename, filled on first use
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._files)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        
+        file_info = self._files[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            icon = "🌐" if file_info.get('is_public', False) else "🔒"
+            return f"{icon} {file_info.get('filename', 'Unknown')}"
+        if role == Qt.ItemDataRole.UserRole:
+            return file_info.get('file_path', '')
+        if role == Qt.ItemDataRole.ToolTipRole:
+            # Built on hover only
+            template = self._TT_PUBLIC if file_info.get('is_public', False) else self._TT_PRIVATE
+            return template.format(
+                file_info.get('sender', 'Unknown'),
+                file_info.get('timestamp', ''),
+                file_info.get('file_path', '')
+            )
+        if role == _EXISTS_ROLE:
+            return self._stat_cache.get(file_info.get('file_path', ''))
+        if role == _BASENAME_ROLE:
+            file_path = file_info.get('file_path', '')
+            basename = self._basenames.get(file_path)
+            if basename is None:
+                basename = self._basenames[file_path] = os.path.basename(file_path)
+            return basename
+        return None
+    
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != _EXISTS_ROLE:
+            return False
+        self._stat_cache[self._files[index.row()].get('file_path', '')] = value
+        return True
+    
+    def set_files(self, files: List[Dict[str, Any]]) -> None:
+        """Replace the listed files, keeping cached stats for files still present."""
+        self.beginResetModel()
+        self._files = files
+        paths = {f.get('file_path', '') for f in files}
+        self._stat_cache = {p: e for p, e in self._stat_cache.items() if p in paths}
+        self._basenames = {p: n for p, n in self._basenames.items() if p in paths}
+        self.endResetModel()
+    
+    def row_of(self, file_path: str) -> int:
+        """Return the row of the first entry with file_path, or -1."""
+        for row, file_info in enumerate(self._files):
+            if file_info.get('file_path', '') == file_path:
+                return row
+        return -1
+    
+    def update_stat_cache(self, results: Dict[str, tuple]) -> None:
+        """Store stat results for listed files."""
+        self._stat_cache.update(results)
+    
+    def clear_stat_cache(self) -> None:
+        """Forget all cached stats."""
+        self._stat_cache.clear()
+
 
 class FileHistory(BaseComponent):
     """Component for viewing and managing received files."""
@@ -26,15 +227,24 @@ class FileHistory(BaseComponent):
     file_opened = Signal(str)  # Emitted when a file is opened
     file_saved_as = Signal(str, str)  # Emitted when a file is saved as (file_path, new_path)
     
+    # Shared across instances
+    _TITLE_FONT = QFont("Arial", 10, QFont.Weight.Bold)
+    
     def __init__(self, component_id: str, event_bus: EventBus, state_manager: StateManager, parent=None):
         super().__init__(component_id, event_bus, state_manager, parent)
         
         self.file_list = None
+        self._model = None
         self.refresh_button = None
         self.open_button = None
         self.save_as_button = None
         self.current_user = None
         self.files = []  # List of file info dictionaries
+        self._stat_generation = 0
+        self._stat_worker = None
+        self._copy_workers: Dict[str, "_FileCopyWorker"] = {}  # keyed by new_path
+        self._chat_client = None
+        self._request_file_list = None  # Client capability, resolved in set_chat_client()
     
     def setup_ui(self) -> None:
         """Set up the file history UI."""
@@ -42,7 +252,7 @@ class FileHistory(BaseComponent):
         
         # Title
         title_label = QLabel("📁 Received Files:")
-        title_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        title_label.setFont(self._TITLE_FONT)
         layout.addWidget(title_label)
         
         # Button layout
@@ -70,11 +280,14 @@ class FileHistory(BaseComponent):
         
         layout.addLayout(button_layout)
         
-        # File list
-        self.file_list = QListWidget()
-        self.file_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
-        self.file_list.itemSelectionChanged.connect(self._on_selection_changed)
-        self.file_list.itemDoubleClicked.connect(self._on_item_double_clicked)
+        # File list (virtualized: rows are rendered on demand from self.files)
+        self._model = _FileListModel(self)
+        self.file_list = QListView()
+        self.file_list.setModel(self._model)
+        self.file_list.setUniformItemSizes(True)
+        self.file_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.file_list.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.file_list.doubleClicked.connect(self._on_item_double_clicked)
         layout.addWidget(self.file_list)
         
         # Status label
@@ -112,34 +325,38 @@ class FileHistory(BaseComponent):
             return
         
         # Request file list from server
-        if hasattr(self, '_chat_client') and self._chat_client:
+        if self._request_file_list is not None:
             print(f"🔥 DEBUG: FILE HISTORY - Requesting file list from server")
-            self._chat_client.request_file_list()
+            self._request_file_list()
         else:
             logger.warning("Cannot refresh file list: no chat client available")
             print(f"🔥 DEBUG: FILE HISTORY - Cannot refresh: no chat client available")
     
     def _on_selection_changed(self) -> None:
         """Handle file list selection change."""
-        has_selection = len(self.file_list.selectedItems()) > 0
+        has_selection = self._selected_index() is not None
         self.open_button.setEnabled(has_selection)
         self.save_as_button.setEnabled(has_selection)
     
-    def _on_item_double_clicked(self, item: QListWidgetItem) -> None:
+    def _on_item_double_clicked(self, index: QModelIndex) -> None:
         """Handle file list item double-click."""
-        if item:
+        if index.isValid():
             self._open_selected_file()
     
+    def _selected_index(self) -> Optional[QModelIndex]:
+        """Return the selected row's index, if any."""
+        indexes = self.file_list.selectionModel().selectedIndexes()
+        return indexes[0] if indexes else None
+    
     def _open_selected_file(self) -> None:
         """Open the selected file."""
-        selected_items = self.file_list.selectedItems()
-        if not selected_items:
+        index = self._selected_index()
+        if index is None:
             return
         
-        item = selected_items[0]
-        file_path = item.data(Qt.ItemDataRole.UserRole)
+        file_path = index.data(Qt.ItemDataRole.UserRole)
         
-        if not file_path or not os.path.exists(file_path):
+        if not file_path or not self._file_exists(index, file_path):
             QMessageBox.warning(
                 self,
                 "File Not Found",
@@ -149,20 +366,24 @@ class FileHistory(BaseComponent):
         
         try:
             # Open file with default system application
-            import subprocess
-            import platform
-            
-            if platform.system() == 'Windows':
+            if _IS_WINDOWS:
                 os.startfile(file_path)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.run(['open', file_path])
-            else:  # Linux and others
-                subprocess.run(['xdg-open', file_path])
+            else:
+                # Launch the opener detached so the GUI thread never waits on it
+                opener = 'open' if _IS_DARWIN else 'xdg-open'
+                subprocess.Popen(
+                    [opener, file_path],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                    close_fds=True,
+                )
             
             logger.info(f"Opened file: {file_path}")
             self.file_opened.emit(file_path)
             
-        except Exception as e:
+        except (OSError, FileNotFoundError) as e:
             logger.error(f"Error opening file {file_path}: {e}")
             QMessageBox.warning(
                 self,
@@ -170,16 +391,30 @@ class FileHistory(BaseComponent):
                 f"Could not open file:\n{e}"
             )
     
+    def _file_exists(self, index: QModelIndex, file_path: str) -> bool:
+        """Check whether a row's file exists, using the cached stat when fresh."""
+        cached = index.data(_EXISTS_ROLE)
+        if cached and cached[0] and time.monotonic() - cached[2] < _EXISTS_CACHE_TTL:
+            return True
+        
+        # Cache miss, stale entry or previous failure: verify against the filesystem
+        entry = _stat_entry(file_path)
+        self._model.setData(index, entry, _EXISTS_ROLE)
+        return entry[0]
+    
+    def _invalidate_exists_cache(self) -> None:
+        """Drop cached existence checks for all listed files."""
+        self._model.clear_stat_cache()
+    
     def _save_selected_file_as(self) -> None:
         """Save the selected file to a different location."""
-        selected_items = self.file_list.selectedItems()
-        if not selected_items:
+        index = self._selected_index()
+        if index is None:
             return
         
-        item = selected_items[0]
-        file_path = item.data(Qt.ItemDataRole.UserRole)
+        file_path = index.data(Qt.ItemDataRole.UserRole)
         
-        if not file_path or not os.path.exists(file_path):
+        if not file_path or not self._file_exists(index, file_path):
             QMessageBox.warning(
                 self,
                 "File Not Found",
@@ -188,7 +423,7 @@ class FileHistory(BaseComponent):
             return
         
         # Get original filename
-        original_filename = os.path.basename(file_path)
+        original_filename = index.data(_BASENAME_ROLE)
         
         # Open save dialog
         new_path, _ = QFileDialog.getSaveFileName(
@@ -199,25 +434,33 @@ class FileHistory(BaseComponent):
         )
         
         if new_path:
-            try:
-                import shutil
-                shutil.copy2(file_path, new_path)
-                logger.info(f"Saved file as: {new_path}")
-                self.file_saved_as.emit(file_path, new_path)
-                
-                QMessageBox.information(
-                    self,
-                    "File Saved",
-                    f"File saved successfully to:\n{new_path}"
-                )
-                
-            except Exception as e:
-                logger.error(f"Error saving file: {e}")
-                QMessageBox.warning(
-                    self,
-                    "Error Saving File",
-                    f"Could not save file:\n{e}"
-                )
+            # Copy off the GUI thread so large files don't freeze the window
+            worker = _FileCopyWorker(file_path, new_path)
+            worker.signals.copy_finished.connect(self._on_copy_finished)
+            self._copy_workers[new_path] = worker
+            QThreadPool.globalInstance().start(worker)
+    
+    def _on_copy_finished(self, file_path: str, new_path: str, error: str) -> None:
+        """Report the result of a background Save As copy."""
+        self._copy_workers.pop(new_path, None)
+        
+        if error:
+            logger.error(f"Error saving file: {error}")
+            QMessageBox.warning(
+                self,
+                "Error Saving File",
+                f"Could not save file:\n{error}"
+            )
+            return
+        
+        logger.info(f"Saved file as: {new_path}")
+        self.file_saved_as.emit(file_path, new_path)
+        
+        QMessageBox.information(
+            self,
+            "File Saved",
+            f"File saved successfully to:\n{new_path}"
+        )
     
     def _handle_file_list_received(self, event: Event) -> None:
         """Handle file list received from server."""
@@ -225,6 +468,8 @@ class FileHistory(BaseComponent):
         print(f"🔥 DEBUG: FILE HISTORY - Received file list from server: {len(file_list)} files")
         for i, file_info in enumerate(file_list):
             print(f"🔥 DEBUG: FILE HISTORY - File {i+1}: {file_info.get('filename', 'unknown')} from {file_info.get('sender', 'unknown')}")
+            # Normalize once so sorting can use a plain itemgetter
+            file_info.setdefault('timestamp', '')
         self._update_file_list(file_list)
     
     def _handle_file_transfer_complete(self, event: Event) -> None:
@@ -235,6 +480,9 @@ class FileHistory(BaseComponent):
         
         print(f"🔥 DEBUG: FILE HISTORY - Received FILE_TRANSFER_COMPLETE event: transfer_id={transfer_id}, success={success}, file_path={file_path}")
         
+        # Files on disk may have changed; stop trusting cached stats
+        self._invalidate_exists_cache()
+        
         if success and file_path:
             # Refresh file list to include the new file
             print(f"🔥 DEBUG: FILE HISTORY - Refreshing file list for completed transfer: {file_path}")
@@ -246,40 +494,57 @@ class FileHistory(BaseComponent):
     def _update_file_list(self, file_list: List[Dict[str, Any]]) -> None:
         """Update the file list display."""
         self.files = file_list
-        self.file_list.clear()
+        
+        # Remember the selection so it survives the model reset
+        index = self._selected_index()
+        selected_path = index.data(Qt.ItemDataRole.UserRole) if index is not None else None
         
         if not file_list:
+            # Invalidate any stat pass still running against the old list
+            self._stat_generation += 1
+            self._model.set_files([])
+            self._on_selection_changed()
             self.status_label.setText("No files received yet")
             return
         
         # Sort files by date (newest first)
-        sorted_files = sorted(file_list, key=lambda x: x.get('timestamp', ''), reverse=True)
+        sorted_files = sorted(file_list, key=_by_timestamp, reverse=True)
+        self._model.set_files(sorted_files)
         
-        for file_info in sorted_files:
-            filename = file_info.get('filename', 'Unknown')
-            file_path = file_info.get('file_path', '')
-            is_public = file_info.get('is_public', False)
-            sender = file_info.get('sender', 'Unknown')
-            timestamp = file_info.get('timestamp', '')
-            
-            # Create display text
-            if is_public:
-                display_text = f"🌐 {filename}"
-                tooltip = f"Public file from {sender}\nReceived: {timestamp}\nPath: {file_path}"
-            else:
-                display_text = f"🔒 {filename}"
-                tooltip = f"Private file from {sender}\nReceived: {timestamp}\nPath: {file_path}"
-            
-            # Create item and add to list
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.ItemDataRole.UserRole, file_path)
-            item.setToolTip(tooltip)
-            self.file_list.addItem(item)
+        if selected_path is not None:
+            row = self._model.row_of(selected_path)
+            if row >= 0:
+                self.file_list.setCurrentIndex(self._model.index(row))
+        self._on_selection_changed()
+        
+        # Stat all files off the GUI thread
+        self._schedule_stat_worker(list({f.get('file_path', '') for f in sorted_files}))
         
         # Update status
         self.status_label.setText(f"📁 {len(file_list)} files received")
         logger.info(f"Updated file list with {len(file_list)} files")
     
+    def _schedule_stat_worker(self, file_paths: List[str]) -> None:
+        """Start a background pass that stats every listed file."""
+        self._stat_generation += 1
+        file_paths = [path for path in file_paths if path]
+        if not file_paths:
+            return
+        
+        worker = _FileStatWorker(self._stat_generation, file_paths)
+        worker.signals.finished.connect(self._apply_stat_results)
+        self._stat_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _apply_stat_results(self, generation: int, results: Dict[str, tuple]) -> None:
+        """Store background stat results in the list model."""
+        if generation != self._stat_generation:
+            return  # List was rebuilt since this pass started
+        
+        self._model.update_stat_cache(results)
+        
+        self._stat_worker = None
+    
     def on_state_change(self, change) -> None:
         """Handle state changes."""
         if change.key == StateKeys.CURRENT_USER:
@@ -291,3 +556,4 @@ class FileHistory(BaseComponent):
     def set_chat_client(self, chat_client) -> None:
         """Set the chat client for requesting file lists."""
         self._chat_client = chat_client
+        self._request_file_list = getattr(chat_client, 'request_file_list', None) if chat_client else None
@@ -2,9 +2,11 @@
 Notification manager for tracking new messages and unread counts.
 """
 
-from typing import Dict, Any, Optional, Set
+from typing import Dict, Any, Optional
+import functools
 import logging
-from PySide6.QtCore import QObject, Signal
+import sys
+from PySide6.QtCore import QObject, Signal, QTimer
 
 from ...core.event_bus import EventBus, Event, ChatEvents
 from ...core.state_manager import StateManager, StateKeys
@@ -13,15 +15,28 @@ from ..base.base_component import BaseComponent
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _private_ctx(a: str, b: str) -> str:
+    """Build the order-independent context ID for a private chat between two users."""
+    # Interned so every holder of this ID shares one object and its cached hash
+    return sys.intern(f"private_{a}_{b}" if a < b else f"private_{b}_{a}")
+
+
 class NotificationManager(BaseComponent):
     """Manages message notifications and unread counts."""
     
     def __init__(self, component_id: str, event_bus: EventBus, state_manager: StateManager, parent=None):
         super().__init__(component_id, event_bus, state_manager, parent)
         
-        # Track notifications for each context
-        self._notifications: Dict[str, Set[str]] = {}  # context_id -> set of message_ids
+        # Unread counts are the single source of truth for notifications
         self._unread_counts: Dict[str, int] = {}  # context_id -> count
+        
+        # Coalesce bursts of count changes into one state update
+        self._dirty = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_notification_state)
     
     def setup_ui(self) -> None:
         """Set up UI (not needed for notification manager)."""
@@ -29,7 +44,7 @@ class NotificationManager(BaseComponent):
     
     def setup_event_handlers(self) -> None:
         """Set up event handlers."""
-        self.subscribe_to_event(ChatEvents.MESSAGE_RECEIVED, self._handle_message_received)
+        self.subscribe_to_event(ChatEvents.MESSAGE_RECEIVED_BATCH, self._handle_message_batch_received)
         self.subscribe_to_event(ChatEvents.CONTEXT_SWITCHED, self._handle_context_switched)
         self.subscribe_to_event(ChatEvents.COMMON_CHAT_SELECTED, self._handle_common_chat_selected)
         self.subscribe_to_event(ChatEvents.USER_SELECTED, self._handle_user_selected)
@@ -46,18 +61,29 @@ class NotificationManager(BaseComponent):
         self._update_notification_state()
         logger.info("Notification manager initialized")
     
-    def _handle_message_received(self, event: Event) -> None:
-        """Handle received message to update notifications."""
-        message = event.data.get("message")
-        if not message:
+    def _handle_message_batch_received(self, event: Event) -> None:
+        """Handle a batch of received messages to update notifications."""
+        messages = event.data.get("messages")
+        if not messages:
             return
         
         current_user = self.get_state(StateKeys.CURRENT_USER)
         if not current_user:
             return
         
-        # Don't show notifications for messages sent by current user
+        for message in messages:
+            if message:
+                self._count_received_message(message, current_user)
+    
+    def _count_received_message(self, message: Dict[str, Any], current_user: str) -> None:
+        """Add a notification for a received message."""
+
+        # Intern so repeated senders share one string and its cached hash
         sender = message.get("sender")
+        if isinstance(sender, str):
+            sender = sys.intern(sender)
+        
+        # Don't show notifications for messages sent by current user
         if sender == current_user:
             return
         
@@ -69,10 +95,10 @@ class NotificationManager(BaseComponent):
             context_id = "common"
         else:
             # For private messages, find the context with the sender
-            context_id = f"private_{sender}_{current_user}" if sender < current_user else f"private_{current_user}_{sender}"
+            context_id = _private_ctx(sender, current_user)
         
         # Add notification for this context
-        self._add_notification(context_id, message.get("content", ""))
+        self._add_notification(context_id)
         
         logger.info(f"🔔 Added notification for context: {context_id}")
     
@@ -100,7 +126,7 @@ class NotificationManager(BaseComponent):
             return
         
         # Create context ID for private chat with this user
-        context_id = f"private_{user}_{current_user}" if user < current_user else f"private_{current_user}_{user}"
+        context_id = _private_ctx(user, current_user)
         self._clear_notifications(context_id)
         logger.info(f"🔔 Cleared notifications for user chat: {context_id}")
     
@@ -111,32 +137,40 @@ class NotificationManager(BaseComponent):
             self._clear_notifications(context_id)
             logger.info(f"🔔 Cleared notifications for sent message context: {context_id}")
     
-    def _add_notification(self, context_id: str, message_content: str) -> None:
+    def _add_notification(self, context_id: str) -> None:
         """Add a notification for a specific context."""
-        if context_id not in self._notifications:
-            self._notifications[context_id] = set()
-        
-        # Use message content as a simple identifier (in real app, use message ID)
-        message_id = f"{context_id}_{message_content}_{len(self._notifications[context_id])}"
-        self._notifications[context_id].add(message_id)
-        
-        # Update unread count
-        self._unread_counts[context_id] = len(self._notifications[context_id])
+        self._unread_counts[context_id] = self._unread_counts.get(context_id, 0) + 1
         
         # Update state
         self._update_notification_state()
     
     def _clear_notifications(self, context_id: str) -> None:
         """Clear notifications for a specific context."""
-        if context_id in self._notifications:
-            self._notifications[context_id].clear()
-            self._unread_counts[context_id] = 0
-            self._update_notification_state()
+        if self._unread_counts.get(context_id, 0) == 0:
+            return  # Nothing unread, avoid a redundant state update
+        
+        self._unread_counts[context_id] = 0
+        self._update_notification_state()
     
     def _update_notification_state(self) -> None:
+        """Schedule a notification state update."""
+        self._dirty = True
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_notification_state(self) -> None:
         """Update the notification state in the state manager."""
-        self.set_state(StateKeys.MESSAGE_NOTIFICATIONS, self._notifications.copy())
-        self.set_state(StateKeys.UNREAD_COUNTS, self._unread_counts.copy())
+        if not self._dirty:
+            return
+        self._dirty = False
+        
+        # The state manager stores its own copy, so a plain snapshot is enough
+        self.set_state(StateKeys.UNREAD_COUNTS, dict(self._unread_counts))
+    
+    def on_cleanup(self) -> None:
+        """Stop pending notification updates."""
+        self._flush_timer.stop()
+        self._dirty = False
     
     def get_unread_count(self, context_id: str) -> int:
         """Get unread count for a specific context."""
@@ -2,11 +2,12 @@
 Selectable user list component for chat context creation.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+import functools
 import logging
-from PySide6.QtWidgets import (QListWidget, QListWidgetItem, QVBoxLayout, 
+from PySide6.QtWidgets import (QListView, QAbstractItemView, QVBoxLayout, 
                               QLabel, QWidget, QHBoxLayout)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer, QAbstractListModel, QModelIndex, QSignalBlocker
 from PySide6.QtGui import QFont, QColor, QPainter, QBrush
 
 from ...core.event_bus import EventBus, Event, ChatEvents
@@ -16,6 +17,128 @@ from ..base.base_component import BaseComponent
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_user_label(kind: str, name: str, count: int) -> Tuple[str, str]:
+    """Build the (text, tooltip) pair for a common or user row."""
+    if kind == "common":
+        if count > 0:
+            return "🌐 Common Chat 🔴", f"Public chat room for all users ({count} new messages)"
+        return "🌐 Common Chat", "Public chat room for all users"
+    
+    # Item text with notification indicator
+    if count > 0:
+        return f"👤 {name} 🔴", f"Click to start private chat with {name} ({count} new messages)"
+    return f"👤 {name}", f"Click to start private chat with {name}"
+
+
+class UserListModel(QAbstractListModel):
+    """List model for the chat room rows (common chat, separator, users)."""
+    
+    # Row keys for non-selectable rows
+    SEPARATOR_KEY = "__sep__"
+    PLACEHOLDER_KEY = "__placeholder__"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Each row: {"kind", "key", "text", "tooltip", "unread"}
+        self._rows: List[Dict[str, Any]] = []
+        self._selected_key: Optional[str] = None
+        
+        # Shared brushes, handed out on every data() call instead of rebuilt
+        self._brush_gray = QBrush(Qt.GlobalColor.gray)
+        self._brush_blue = QBrush(Qt.GlobalColor.blue)
+        self._brush_white = QBrush(Qt.GlobalColor.white)
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row["text"]
+        if role == Qt.ItemDataRole.UserRole:
+            # Only selectable rows carry a key for click handling
+            return row["key"] if row["kind"] != "static" else None
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return row["tooltip"]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._brush_gray if row["kind"] == "static" else None
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if self._selected_key is None:
+                return None
+            if row["key"] == self._selected_key:
+                return self._brush_blue
+            return self._brush_white
+        return None
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if self._rows[index.row()]["kind"] == "static":
+            return Qt.ItemFlag.NoItemFlags  # Non-selectable
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    
+    def apply_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Diff the current rows against the desired rows and apply the deltas."""
+        wanted = {row["key"] for row in rows}
+        
+        # Remove rows that are gone (back to front so indices stay valid)
+        for idx in range(len(self._rows) - 1, -1, -1):
+            if self._rows[idx]["key"] not in wanted:
+                self.beginRemoveRows(QModelIndex(), idx, idx)
+                del self._rows[idx]
+                self.endRemoveRows()
+        
+        # Remaining rows keep their relative order, so a single walk inserts the rest
+        for idx, row in enumerate(rows):
+            if idx < len(self._rows) and self._rows[idx]["key"] == row["key"]:
+                if self._rows[idx]["unread"] != row["unread"]:
+                    self._rows[idx] = row
+                    index = self.index(idx)
+                    self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole,
+                                                         Qt.ItemDataRole.ToolTipRole])
+                continue
+            
+            self.beginInsertRows(QModelIndex(), idx, idx)
+            self._rows.insert(idx, row)
+            self.endInsertRows()
+    
+    def row_of(self, key: str) -> int:
+        """Return the row index for a key, or -1."""
+        for idx, row in enumerate(self._rows):
+            if row["key"] == key:
+                return idx
+        return -1
+    
+    def selected_key(self) -> Optional[str]:
+        """Return the key of the highlighted row."""
+        return self._selected_key
+    
+    def set_selected_key(self, key: Optional[str]) -> None:
+        """Highlight the row with the given key."""
+        previous = self._selected_key
+        if key == previous or not self._rows:
+            self._selected_key = key
+            return
+        self._selected_key = key
+        
+        roles = [Qt.ItemDataRole.BackgroundRole]
+        if previous is None or key is None:
+            # Every row switches between unhighlighted and white
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1), roles)
+            return
+        
+        # Only the old and new highlighted rows change
+        for changed_key in (previous, key):
+            row = self.row_of(changed_key)
+            if row >= 0:
+                index = self.index(row)
+                self.dataChanged.emit(index, index, roles)
+
+
 class UserList(BaseComponent):
     """Selectable user list component for chat context creation."""
     
@@ -27,9 +150,23 @@ class UserList(BaseComponent):
         super().__init__(component_id, event_bus, state_manager, parent)
         
         self.user_list = None
+        self._model = None
         self.current_user = None
-        self.users = []
-        self.selected_item = None
+        self.users: Tuple[str, ...] = ()
+        
+        # Sorted roster without the current user, keyed by (users, current_user)
+        self._sorted_cache_key = None
+        self._sorted_cache: List[str] = []
+        self._context_id_by_user: Dict[str, str] = {}
+        
+        # Set when a refresh was skipped while hidden; replayed on show
+        self._dirty = False
+        
+        # Coalesce bursts of updates into at most one refresh per frame
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(16)
+        self._refresh_timer.timeout.connect(self._flush_user_list)
     
     def setup_ui(self) -> None:
         """Set up the user list UI."""
@@ -40,11 +177,14 @@ class UserList(BaseComponent):
         title_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
         layout.addWidget(title_label)
         
-        # User list
-        self.user_list = QListWidget()
-        self.user_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
-        self.user_list.itemClicked.connect(self._on_item_clicked)
-        self.user_list.itemDoubleClicked.connect(self._on_item_double_clicked)
+        # User list (model/view so only visible rows are rendered)
+        self._model = UserListModel(self)
+        self.user_list = QListView()
+        self.user_list.setModel(self._model)
+        self.user_list.setUniformItemSizes(True)
+        self.user_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.user_list.clicked.connect(self._on_item_clicked)
+        self.user_list.doubleClicked.connect(self._on_item_double_clicked)
         layout.addWidget(self.user_list)
     
     def setup_event_handlers(self) -> None:
@@ -78,11 +218,12 @@ class UserList(BaseComponent):
     
     def _load_users(self) -> None:
         """Load users from state."""
-        users = self.get_state(StateKeys.USER_LIST, [])
+        users = tuple(self.get_state(StateKeys.USER_LIST, ()))
         current_user = self.get_state(StateKeys.CURRENT_USER)
         
         if users != self.users or current_user != self.current_user:
-            self.users = users.copy()
+            # Tuples are immutable, so the roster can be shared without copying
+            self.users = users
             self.current_user = current_user
             self._update_user_list()
     
@@ -93,128 +234,132 @@ class UserList(BaseComponent):
             self._select_context_item(current_context)
     
     def _update_user_list(self) -> None:
-        """Update the user list display."""
+        """Update the user list display, touching only rows that changed."""
         if not self.user_list:
             logger.warning("User list widget is None, cannot update")
             return
         
-        logger.info(f"Updating user list - users: {self.users}, current_user: {self.current_user}")
+        if not self.isVisible():
+            # Nothing to paint while hidden; rebuild once when shown again
+            self._dirty = True
+            return
         
-        self.user_list.clear()
+        logger.info(f"Updating user list - users: {self.users}, current_user: {self.current_user}")
         
-        # Add "Common Chat" option first
         unread_counts = self.get_state(StateKeys.UNREAD_COUNTS, {})
+        
+        rows = []
+        
+        # "Common Chat" option first
         common_unread_count = unread_counts.get("common", 0)
+        common_text, common_tooltip = _format_user_label("common", "", common_unread_count)
+        rows.append({"kind": "common", "key": "common", "text": common_text,
+                     "tooltip": common_tooltip, "unread": common_unread_count})
         
-        if common_unread_count > 0:
-            common_text = "🌐 Common Chat 🔴"
-            common_tooltip = f"Public chat room for all users ({common_unread_count} new messages)"
-        else:
-            common_text = "🌐 Common Chat"
-            common_tooltip = "Public chat room for all users"
-        
-        common_item = QListWidgetItem(common_text)
-        common_item.setData(Qt.ItemDataRole.UserRole, "common")
-        common_item.setToolTip(common_tooltip)
-        self.user_list.addItem(common_item)
-        logger.debug(f"Added Common Chat item (unread: {common_unread_count})")
-        
-        # Add separator
-        separator_item = QListWidgetItem("─" * 20)
-        separator_item.setFlags(Qt.ItemFlag.NoItemFlags)  # Non-selectable
-        separator_item.setForeground(Qt.GlobalColor.gray)
-        self.user_list.addItem(separator_item)
-        
-        # Add users (excluding current user)
+        # Separator
+        rows.append({"kind": "static", "key": UserListModel.SEPARATOR_KEY, "text": "─" * 20,
+                     "tooltip": None, "unread": 0})
+        
+        # Users (excluding current user), sorted alphabetically
         if self.users:
-            # Sort users alphabetically
-            sorted_users = sorted(self.users)
-            logger.debug(f"Sorted users: {sorted_users}")
+            for user in self._get_other_users_sorted():
+                unread_count = unread_counts.get(self._context_id_by_user.get(user), 0)
+                item_text, tooltip = _format_user_label("user", user, unread_count)
+                rows.append({"kind": "user", "key": f"user_{user}", "text": item_text,
+                             "tooltip": tooltip, "unread": unread_count})
+        else:
+            # If no users, add a placeholder
+            rows.append({"kind": "static", "key": UserListModel.PLACEHOLDER_KEY,
+                         "text": "No other users online", "tooltip": None, "unread": 0})
+        
+        # One repaint and no view signals for the whole batch of row changes
+        self.user_list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.user_list):
+                self._model.apply_rows(rows)
+        finally:
+            self.user_list.setUpdatesEnabled(True)
+        
+        logger.info(f"Updated user list with {len(self.users)} users, total items: {self._model.rowCount()}")
+    
+    def _get_other_users_sorted(self) -> List[str]:
+        """Return other users in display order, re-sorting only when the roster changes."""
+        key = (self.users, self.current_user)
+        if key != self._sorted_cache_key:
+            # Don't show current user in the list
+            self._sorted_cache = [u for u in sorted(self.users) if u != self.current_user]
+            self._sorted_cache_key = key
             
-            # Add other users (excluding current user)
-            for user in sorted_users:
-                if user != self.current_user:  # Don't show current user in the list
-                    # Check for notifications
-                    unread_counts = self.get_state(StateKeys.UNREAD_COUNTS, {})
-                    context_id = f"private_{user}_{self.current_user}" if user < self.current_user else f"private_{self.current_user}_{user}"
-                    unread_count = unread_counts.get(context_id, 0)
-                    
-                    # Create item text with notification indicator
-                    if unread_count > 0:
-                        item_text = f"👤 {user} 🔴"
-                        tooltip = f"Click to start private chat with {user} ({unread_count} new messages)"
-                    else:
-                        item_text = f"👤 {user}"
-                        tooltip = f"Click to start private chat with {user}"
-                    
-                    user_item = QListWidgetItem(item_text)
-                    user_item.setData(Qt.ItemDataRole.UserRole, f"user_{user}")
-                    user_item.setToolTip(tooltip)
-                    self.user_list.addItem(user_item)
-                    logger.debug(f"Added user item: {user} (unread: {unread_count})")
-        
-        # If no users, add a placeholder
-        if not self.users:
-            placeholder_item = QListWidgetItem("No other users online")
-            placeholder_item.setFlags(Qt.ItemFlag.NoItemFlags)  # Non-selectable
-            placeholder_item.setForeground(Qt.GlobalColor.gray)
-            self.user_list.addItem(placeholder_item)
-            logger.debug("Added placeholder item")
-        
-        logger.info(f"Updated user list with {len(self.users)} users, total items: {self.user_list.count()}")
+            # Private context IDs depend on the same inputs, so rebuild them together
+            self._context_id_by_user = {}
+            if self.current_user:
+                for user in self._sorted_cache:
+                    a, b = sorted((user, self.current_user))
+                    self._context_id_by_user[user] = f"private_{a}_{b}"
+        return self._sorted_cache
+    
+    def _schedule_user_list_update(self) -> None:
+        """Request a deferred user list refresh."""
+        self._refresh_timer.start()
+    
+    def _flush_user_list(self) -> None:
+        """Run a deferred refresh and re-select the current context."""
+        self._update_user_list()
+        current_context = self.get_state(StateKeys.CURRENT_CHAT_CONTEXT)
+        if current_context:
+            self._select_context_item(current_context)
     
     def _select_context_item(self, context_id: str) -> None:
         """Select the item corresponding to the current context."""
         if not self.user_list:
             return
         
-        # Find and select the appropriate item
-        for i in range(self.user_list.count()):
-            item = self.user_list.item(i)
-            if item and item.data(Qt.ItemDataRole.UserRole):
-                item_data = item.data(Qt.ItemDataRole.UserRole)
-                
-                if context_id == "common" and item_data == "common":
-                    self.user_list.setCurrentItem(item)
-                    self.selected_item = item
-                    item.setBackground(Qt.GlobalColor.blue)
-                    logger.debug("Selected Common Chat item")
-                    break
-                elif context_id.startswith("private_") and item_data.startswith("user_"):
-                    # Extract username from context ID
-                    context_user = self._extract_user_from_context(context_id)
-                    item_user = item_data.replace("user_", "")
-                    if context_user == item_user:
-                        self.user_list.setCurrentItem(item)
-                        self.selected_item = item
-                        item.setBackground(Qt.GlobalColor.blue)
-                        logger.debug(f"Selected private chat item for user: {context_user}")
-                        break
-        
-        # Clear selection from other items
-        for i in range(self.user_list.count()):
-            item = self.user_list.item(i)
-            if item and item != self.selected_item:
-                item.setBackground(Qt.GlobalColor.white)
+        # Map the context straight to its row key, then locate that row once
+        if context_id == "common":
+            key = "common"
+        elif context_id.startswith("private_"):
+            key = f"user_{self._extract_user_from_context(context_id)}"
+        else:
+            key = None
+        
+        row = self._model.row_of(key) if key else -1
+        if row < 0:
+            return
+        
+        self.user_list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.user_list):
+                self.user_list.setCurrentIndex(self._model.index(row))
+                # Highlight the selected row and clear the previous one
+                self._model.set_selected_key(key)
+        finally:
+            self.user_list.setUpdatesEnabled(True)
+        
+        if key == "common":
+            logger.debug("Selected Common Chat item")
+        else:
+            logger.debug(f"Selected private chat item for user: {key[5:]}")
     
     def _extract_user_from_context(self, context_id: str) -> Optional[str]:
-        """Extract username from private context ID."""
-        if context_id.startswith("private_"):
-            parts = context_id.split("_")
-            if len(parts) >= 2:
-                return parts[1]
-        return None
+        """Extract the other participant's username from a private context ID."""
+        if not context_id.startswith("private_"):
+            return None
+        
+        # Layout is private_<user>_<suffix>; slice instead of splitting into a list
+        first, _, rest = context_id[8:].partition("_")
+        if first == self.current_user and rest:
+            # Sorted-pair IDs (private_<a>_<b>) may list the current user first
+            return rest.partition("_")[0]
+        return first
     
-    def _on_item_clicked(self, item: QListWidgetItem) -> None:
+    def _on_item_clicked(self, index: QModelIndex) -> None:
         """Handle item click."""
-        if not item or not item.data(Qt.ItemDataRole.UserRole):
+        item_data = index.data(Qt.ItemDataRole.UserRole) if index.isValid() else None
+        if not item_data:
             return
         
-        item_data = item.data(Qt.ItemDataRole.UserRole)
-        self.selected_item = item
-        
         # Visual feedback
-        item.setBackground(Qt.GlobalColor.blue)
+        self._model.set_selected_key(item_data)
         
         if item_data == "common":
             # Common chat selected
@@ -226,9 +371,9 @@ class UserList(BaseComponent):
             logger.debug(f"User clicked on user: {username}")
             self._select_user(username)
     
-    def _on_item_double_clicked(self, item: QListWidgetItem) -> None:
+    def _on_item_double_clicked(self, index: QModelIndex) -> None:
         """Handle item double-click (same as single click for now)."""
-        self._on_item_clicked(item)
+        self._on_item_clicked(index)
     
     def _select_common_chat(self) -> None:
         """Select common chat."""
@@ -259,16 +404,18 @@ class UserList(BaseComponent):
         
         logger.info(f"🔔 UserList: Published USER_SELECTED event for user: {username}")
     
+    def _set_users(self, incoming) -> bool:
+        """Store a new roster; return False when it matches the current one."""
+        users = tuple(incoming)
+        if users == self.users:
+            return False  # Spurious update (e.g. after reconnect), nothing to redraw
+        self.users = users
+        return True
+    
     def _handle_user_list_updated(self, event: Event) -> None:
         """Handle user list updates."""
-        users = event.data.get("users", [])
-        if users != self.users:
-            self.users = users.copy()
-            self._update_user_list()
-            # Re-select current context
-            current_context = self.get_state(StateKeys.CURRENT_CHAT_CONTEXT)
-            if current_context:
-                self._select_context_item(current_context)
+        if self._set_users(event.data.get("users", ())):
+            self._schedule_user_list_update()
     
     def _handle_context_switched(self, event: Event) -> None:
         """Handle context switching."""
@@ -280,25 +427,19 @@ class UserList(BaseComponent):
         """Handle state changes."""
         if change.key == StateKeys.USER_LIST:
             # User list updated
-            users = change.new_value or []
-            if users != self.users:
-                self.users = users.copy()
-                self._update_user_list()
-                # Re-select current context
-                current_context = self.get_state(StateKeys.CURRENT_CHAT_CONTEXT)
-                if current_context:
-                    self._select_context_item(current_context)
+            if self._set_users(change.new_value or ()):
+                self._schedule_user_list_update()
         
         elif change.key == StateKeys.CURRENT_USER:
             # Current user changed
             current_user = change.new_value
             if current_user != self.current_user:
                 self.current_user = current_user
-                self._update_user_list()
+                self._schedule_user_list_update()
         
         elif change.key == StateKeys.UNREAD_COUNTS:
             # Notification counts changed, update display
-            self._update_user_list()
+            self._schedule_user_list_update()
             logger.info(f"🔔 Updated user list due to notification count changes")
         
         elif change.key == StateKeys.CURRENT_CHAT_CONTEXT:
@@ -307,18 +448,36 @@ class UserList(BaseComponent):
             if current_context:
                 self._select_context_item(current_context)
     
+    def showEvent(self, event) -> None:
+        """Apply any refresh that was deferred while hidden."""
+        super().showEvent(event)
+        if self._dirty:
+            self._dirty = False
+            self._flush_user_list()
+    
+    def hideEvent(self, event) -> None:
+        """Defer a pending refresh until the list is shown again."""
+        super().hideEvent(event)
+        if self._refresh_timer.isActive():
+            self._refresh_timer.stop()
+            self._dirty = True
+    
+    def on_cleanup(self) -> None:
+        """Stop any pending refresh."""
+        self._refresh_timer.stop()
+    
     def get_selected_user(self) -> Optional[str]:
         """Get the currently selected user."""
-        if self.selected_item and self.selected_item.data(Qt.ItemDataRole.UserRole):
-            item_data = self.selected_item.data(Qt.ItemDataRole.UserRole)
+        item_data = self._model.selected_key() if self._model else None
+        if item_data and self._model.row_of(item_data) >= 0:
             if item_data.startswith("user_"):
                 return item_data.replace("user_", "")
         return None
     
     def get_selected_context_type(self) -> Optional[str]:
         """Get the type of currently selected context."""
-        if self.selected_item and self.selected_item.data(Qt.ItemDataRole.UserRole):
-            item_data = self.selected_item.data(Qt.ItemDataRole.UserRole)
+        item_data = self._model.selected_key() if self._model else None
+        if item_data and self._model.row_of(item_data) >= 0:
             if item_data == "common":
                 return "public"
             elif item_data.startswith("user_"):
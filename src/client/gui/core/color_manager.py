@@ -5,6 +5,8 @@ Centralized color management for the chat application.
 from typing import Dict, Optional
 from PySide6.QtGui import QColor
 import logging
+import re
+import zlib
 
 logger = logging.getLogger(__name__)
 
@@ -12,13 +14,19 @@ logger = logging.getLogger(__name__)
 class ColorManager:
     """Manages colors for users and system messages with theme awareness."""
 
+    # Single scan for join/leave announcements; group 1 maps to a system color key
+    _SYS_PATTERN = re.compile(r"(joined|left) the chat")
+    _SYS_SUBTYPES = {"joined": "join", "left": "leave"}
+
     def __init__(self):
         # Initialize color palettes
         self._setup_color_palettes()
 
-        # User color mapping
-        self.user_colors: Dict[str, QColor] = {}
-        self.next_color_idx = 0
+        # Per-theme user color caches; colors are a pure function of username + theme,
+        # so both are filled together and a theme switch just swaps the active map
+        self.user_colors_light: Dict[str, QColor] = {}
+        self.user_colors_dark: Dict[str, QColor] = {}
+        self.user_colors: Dict[str, QColor] = self.user_colors_dark
 
         # Detect current theme (assume dark theme for now)
         self.is_dark_theme = True
@@ -76,19 +84,20 @@ class ColorManager:
         if username == current_user:
             return self.current_system_colors["sent"]
 
-        if username not in self.user_colors:
-            self._assign_user_color(username)
+        color = self.user_colors.get(username)
+        if color is None:
+            color = self._assign_user_color(username)
 
-        return self.user_colors[username]
+        return color
 
     def get_system_color(self, message_content: str) -> QColor:
         """Get color for system messages based on content."""
-        if "joined the chat" in message_content:
-            return self.current_system_colors["join"]
-        elif "left the chat" in message_content:
-            return self.current_system_colors["leave"]
-        else:
-            return self.current_system_colors["system"]
+        return self.current_system_colors[self._system_subtype(message_content)]
+
+    def _system_subtype(self, message_content: str) -> str:
+        """Classify system message content as 'join', 'leave' or 'system'."""
+        match = self._SYS_PATTERN.search(message_content)
+        return self._SYS_SUBTYPES[match.group(1)] if match else "system"
 
     def get_message_color(self, message: Dict, current_user: str) -> QColor:
         """Get appropriate color for any message."""
@@ -96,9 +105,15 @@ class ColorManager:
         content = message.get("content", "")
         sender = message.get("sender", "")
 
+        # Messages that already carry a subtype skip the content scan
+        subtype = message.get("subtype")
+        if subtype in ("join", "leave", "system"):
+            return self.current_system_colors[subtype]
+
         # System messages
-        if message_type == "system" or "joined the chat" in content or "left the chat" in content:
-            return self.get_system_color(content)
+        subtype = self._system_subtype(content)
+        if message_type == "system" or subtype != "system":
+            return self.current_system_colors[subtype]
 
         # User messages
         return self.get_user_color(sender, current_user)
@@ -110,37 +125,27 @@ class ColorManager:
         if is_dark:
             self.current_user_palette = self.dark_user_palette
             self.current_system_colors = self.dark_system_colors
+            self.user_colors = self.user_colors_dark
         else:
             self.current_user_palette = self.light_user_palette
             self.current_system_colors = self.light_system_colors
-
-        # Reassign colors to maintain consistency
-        self._reassign_user_colors()
+            self.user_colors = self.user_colors_light
 
         logger.info(
             f"Colors adapted to {'dark' if is_dark else 'light'} theme")
 
     def _assign_user_color(self, username: str) -> QColor:
         """Assign a color to a new user."""
-        color = self.current_user_palette[self.next_color_idx % len(
-            self.current_user_palette)]
-        self.user_colors[username] = color
-        self.next_color_idx += 1
+        # crc32 rather than hash(): str hashes are salted per process, and a
+        # user's color should stay the same across sessions
+        digest = zlib.crc32(username.encode("utf-8"))
+        self.user_colors_light[username] = self.light_user_palette[digest % len(self.light_user_palette)]
+        self.user_colors_dark[username] = self.dark_user_palette[digest % len(self.dark_user_palette)]
+        color = self.user_colors[username]
 
         logger.debug(f"Assigned color {color.name()} to user {username}")
         return color
 
-    def _reassign_user_colors(self):
-        """Reassign colors to all users with current theme palette."""
-        usernames = list(self.user_colors.keys())
-        self.user_colors.clear()
-        self.next_color_idx = 0
-
-        for username in usernames:
-            self._assign_user_color(username)
-
-        logger.info(f"Reassigned colors for {len(usernames)} users")
-
     def get_color_info(self) -> Dict:
         """Get information about current color assignments."""
         return {
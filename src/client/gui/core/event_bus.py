@@ -3,8 +3,12 @@ Event bus system for loose coupling between GUI components.
 """
 
 import asyncio
-from typing import Dict, List, Callable, Any, Optional
-from dataclasses import dataclass
+import sys
+import time
+from collections import deque
+from itertools import islice
+from typing import Dict, List, Set, Callable, Any, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 
@@ -16,22 +20,58 @@ class Event:
     """Base event class for all GUI events."""
     event_type: str
     data: Dict[str, Any]
-    timestamp: datetime = None
+    timestamp: Optional[datetime] = None
     source: str = None
+    # Creation time in epoch nanoseconds; converted to a datetime only when read
+    _created_ns: int = field(default_factory=time.time_ns, init=False, repr=False, compare=False)
     
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    @classmethod
+    def make(cls, event_type: str, data: Dict[str, Any], source: str = None) -> "Event":
+        """Build an event without the dataclass __init__ keyword handling."""
+        event = object.__new__(cls)
+        event.event_type = event_type
+        event.data = data
+        event.source = source
+        event._timestamp = None
+        event._created_ns = time.time_ns()
+        return event
+
+
+def _get_event_timestamp(self: Event) -> datetime:
+    timestamp = self._timestamp
+    if timestamp is None:
+        timestamp = self._timestamp = datetime.fromtimestamp(self._created_ns / 1e9)
+    return timestamp
+
+
+def _set_event_timestamp(self: Event, value: Optional[datetime]) -> None:
+    self._timestamp = value
+
+
+# Installed after the dataclass is built so the generated __init__ keeps its
+# optional 'timestamp' argument while reads are served lazily
+Event.timestamp = property(_get_event_timestamp, _set_event_timestamp)
 
 
 class EventBus:
     """Centralized event system for component communication."""
     
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable]] = {}
-        self._async_subscribers: Dict[str, List[Callable]] = {}
-        self._event_history: List[Event] = []
+        # Handlers keyed by themselves: O(1) add/remove, insertion order kept for publish
+        self._subscribers: Dict[str, Dict[Callable, Callable]] = {}
+        self._async_subscribers: Dict[str, Dict[Callable, Callable]] = {}
+        # Immutable per-type handler snapshots reused by publish until subscribers change
+        self._dispatch_cache: Dict[str, tuple] = {}
         self._max_history = 1000  # Limit event history size
+        self._event_history: deque = deque(maxlen=self._max_history)
+        # High-volume event types that are never recorded in history
+        self._no_history: Set[str] = {ChatEvents.FILE_TRANSFER_PROGRESS}
+        # Async handlers run on a small fixed pool of worker tasks, started lazily.
+        # Each handler always goes to the same worker's queue, so its events run in order
+        self._async_queues: List[asyncio.Queue] = []
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_workers: List[asyncio.Task] = []
+        self._async_worker_count = 4
         
     def subscribe(self, event_type: str, handler: Callable, async_handler: bool = False) -> None:
         """
@@ -42,16 +82,18 @@ class EventBus:
             handler: Function to call when event is published
             async_handler: Whether the handler is async
         """
+        subscribers = self._async_subscribers if async_handler else self._subscribers
+        subscribers.setdefault(event_type, {})[handler] = handler
+        self._dispatch_cache.pop(event_type, None)
+        
         if async_handler:
-            if event_type not in self._async_subscribers:
-                self._async_subscribers[event_type] = []
-            self._async_subscribers[event_type].append(handler)
-        else:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
-            self._subscribers[event_type].append(handler)
+            try:
+                self._ensure_async_workers()
+            except RuntimeError:
+                pass  # No running loop yet; the first async publish starts the workers
         
-        logger.debug(f"Subscribed {handler.__name__} to {event_type} events")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Subscribed %s to %s events", handler.__name__, event_type)
     
     def unsubscribe(self, event_type: str, handler: Callable, async_handler: bool = False) -> None:
         """
@@ -64,18 +106,16 @@ class EventBus:
         """
         if async_handler:
             if event_type in self._async_subscribers:
-                try:
-                    self._async_subscribers[event_type].remove(handler)
-                except ValueError:
+                if self._async_subscribers[event_type].pop(handler, None) is None:
                     logger.warning(f"Handler {handler.__name__} not found in async subscribers for {event_type}")
         else:
             if event_type in self._subscribers:
-                try:
-                    self._subscribers[event_type].remove(handler)
-                except ValueError:
+                if self._subscribers[event_type].pop(handler, None) is None:
                     logger.warning(f"Handler {handler.__name__} not found in subscribers for {event_type}")
+                self._dispatch_cache.pop(event_type, None)
         
-        logger.debug(f"Unsubscribed {handler.__name__} from {event_type} events")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Unsubscribed %s from %s events", handler.__name__, event_type)
     
     def publish(self, event: Event) -> None:
         """
@@ -84,17 +124,39 @@ class EventBus:
         Args:
             event: The event to publish
         """
-        self._add_to_history(event)
+        event_type = event.event_type
+        if event_type not in self._no_history:
+            self._event_history.append(event)
+        
+        handlers = self._dispatch_cache.get(event_type)
+        if handlers is None:
+            # Snapshot so handlers may (un)subscribe while being called
+            handlers = self._dispatch_cache[event_type] = tuple(self._subscribers.get(event_type, {}).values())
+        if not handlers:
+            return
         
         # Call synchronous handlers
-        if event.event_type in self._subscribers:
-            for handler in self._subscribers[event.event_type]:
-                try:
-                    handler(event)
-                except Exception as e:
-                    logger.error(f"Error in event handler {handler.__name__} for {event.event_type}: {e}")
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                # Only the failure path pays for formatting
+                logger.exception("Error in event handler %s for %s", handler, event_type)
+        
+        logger.debug("Published event %s from %s", event_type, event.source)
+    
+    def publish_fast(self, event_type: str, source: str = None, **data: Any) -> None:
+        """
+        Build and publish an event synchronously from keyword data.
         
-        logger.debug(f"Published event {event.event_type} from {event.source}")
+        Args:
+            event_type: The type of event to publish
+            source: Identifier of the publisher
+            **data: Event data; the keyword dict becomes the event's data
+        """
+        if event_type in self._no_history and not self._dispatch_cache.get(event_type, True):
+            return  # Nobody listens and nothing is recorded
+        self.publish(Event.make(event_type, data, source))
     
     def publish_async(self, event: Event) -> None:
         """
@@ -103,18 +165,50 @@ class EventBus:
         Args:
             event: The event to publish
         """
-        self._add_to_history(event)
+        if event.event_type not in self._no_history:
+            self._add_to_history(event)
         
-        # Call async handlers
-        if event.event_type in self._async_subscribers:
-            for handler in self._async_subscribers[event.event_type]:
-                try:
-                    # Create task for async handler
-                    asyncio.create_task(self._call_async_handler(handler, event))
-                except Exception as e:
-                    logger.error(f"Error creating async task for {handler.__name__} in {event.event_type}: {e}")
+        # Queue async handlers for the worker pool
+        subscribers = self._async_subscribers.get(event.event_type)
+        if subscribers:
+            try:
+                queues = self._ensure_async_workers()
+            except RuntimeError as e:
+                logger.error(f"Cannot dispatch async event {event.event_type}: {e}")
+                return
+            for handler in tuple(subscribers.values()):
+                queues[hash(handler) % len(queues)].put_nowait((handler, event))
         
-        logger.debug(f"Published async event {event.event_type} from {event.source}")
+        logger.debug("Published async event %s from %s", event.event_type, event.source)
+    
+    def _ensure_async_workers(self) -> List[asyncio.Queue]:
+        """Start the async worker pool on the running loop if needed."""
+        loop = asyncio.get_running_loop()  # RuntimeError outside an event loop
+        if self._async_loop is not loop:
+            self._cancel_async_workers()
+            self._async_loop = loop
+            self._async_queues = [asyncio.Queue() for _ in range(self._async_worker_count)]
+            self._async_workers = [
+                loop.create_task(self._async_worker(queue)) for queue in self._async_queues
+            ]
+        return self._async_queues
+    
+    def _cancel_async_workers(self) -> None:
+        """Cancel the worker tasks left on a previous event loop."""
+        old_loop = self._async_loop
+        if old_loop is not None and not old_loop.is_closed():
+            for task in self._async_workers:
+                old_loop.call_soon_threadsafe(task.cancel)
+        self._async_workers = []
+    
+    async def _async_worker(self, queue: asyncio.Queue) -> None:
+        """Run queued async handlers one at a time."""
+        while True:
+            handler, event = await queue.get()
+            try:
+                await self._call_async_handler(handler, event)
+            finally:
+                queue.task_done()
     
     async def _call_async_handler(self, handler: Callable, event: Event) -> None:
         """Call an async handler safely."""
@@ -125,9 +219,8 @@ class EventBus:
     
     def _add_to_history(self, event: Event) -> None:
         """Add event to history, maintaining size limit."""
+        # The deque evicts the oldest event itself once full
         self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
     
     def get_event_history(self, event_type: Optional[str] = None, limit: int = 100) -> List[Event]:
         """
@@ -140,11 +233,23 @@ class EventBus:
         Returns:
             List of recent events
         """
-        events = self._event_history
+        events = reversed(self._event_history)
         if event_type:
-            events = [e for e in events if e.event_type == event_type]
+            events = (e for e in events if e.event_type == event_type)
+        
+        # Walk from the newest end so only the requested events are visited
+        recent = list(islice(events, limit)) if limit > 0 else list(events)
+        recent.reverse()
+        return recent
+    
+    def disable_history_for(self, event_type: str) -> None:
+        """
+        Stop recording events of a specific type in the event history.
         
-        return events[-limit:] if limit > 0 else events
+        Args:
+            event_type: The high-volume event type to exclude from history
+        """
+        self._no_history.add(event_type)
     
     def clear_history(self) -> None:
         """Clear event history."""
@@ -153,8 +258,8 @@ class EventBus:
     
     def get_subscriber_count(self, event_type: str) -> int:
         """Get the number of subscribers for an event type."""
-        sync_count = len(self._subscribers.get(event_type, []))
-        async_count = len(self._async_subscribers.get(event_type, []))
+        sync_count = len(self._subscribers.get(event_type, {}))
+        async_count = len(self._async_subscribers.get(event_type, {}))
         return sync_count + async_count
 
 
@@ -169,6 +274,7 @@ class ChatEvents:
     
     # Message events
     MESSAGE_RECEIVED = "chat.message.received"
+    MESSAGE_RECEIVED_BATCH = "chat.message.received.batch"
     MESSAGE_SENT = "chat.message.sent"
     MESSAGE_TYPE_CHANGED = "chat.message.type.changed"
     
@@ -189,5 +295,12 @@ class ChatEvents:
     SYSTEM_MESSAGE = "system.message"
 
 
+# The dotted names are not interned automatically like identifier-style
+# literals; interning gives every key one shared object for dict lookups
+for _name, _value in list(vars(ChatEvents).items()):
+    if not _name.startswith("_") and isinstance(_value, str):
+        setattr(ChatEvents, _name, sys.intern(_value))
+
+
 # Global event bus instance
 event_bus = EventBus()
@@ -2,13 +2,17 @@
 Main GUI controller for coordinating all components.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
+import functools
 import logging
 import os
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QSplitter
-from PySide6.QtCore import Qt
+import subprocess
+import sys
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QMessageBox
+from collections import deque
+from PySide6.QtCore import Qt, QObject, Signal, Slot, QTimer, QRunnable, QThreadPool, QMetaObject
 
-from .event_bus import EventBus, Event, ChatEvents
+from .event_bus import EventBus, ChatEvents
 from .state_manager import StateManager, StateKeys
 from ..components.base.component_registry import ComponentRegistry, get_component_registry
 from ..components.chat.chat_context_manager import ChatContextManager
@@ -18,13 +22,196 @@ from ..components.chat.file_transfer_input import FileTransferInput
 from ..components.users.user_list import UserList
 from ..components.notifications.notification_manager import NotificationManager
 from ..components.files.file_history import FileHistory
+from ..components.dialogs.file_transfer_dialog import FileTransferDialog
+from src.utils.format_utils import format_file_size
+try:
+    from ....shared.messages.enums import MessageType
+    from ....shared.messages.chat import ChatMessage
+except ImportError:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+    from shared.messages.enums import MessageType
+    from shared.messages.chat import ChatMessage
 
 logger = logging.getLogger(__name__)
 
+# Source tag for every event the controller publishes
+_SOURCE = "gui_controller"
 
-class GUIController:
+# Received messages are published in batches of at most this many
+_MESSAGE_BATCH_LIMIT = 256
+
+# MessageType enum name -> GUI message type string
+_MESSAGE_TYPE_NAMES = {
+    MessageType.PUBLIC_MESSAGE.name: 'public',
+    MessageType.PRIVATE_MESSAGE.name: 'private',
+}
+
+# Same mapping keyed by the members themselves, skipping the .name lookup
+_MESSAGE_TYPE_STRINGS = {
+    MessageType.PUBLIC_MESSAGE: 'public',
+    MessageType.PRIVATE_MESSAGE: 'private',
+}
+
+_MISSING = object()
+
+# Platform checks for opening files, decided once at import
+_IS_WINDOWS = sys.platform == "win32"
+_IS_MAC = sys.platform == "darwin"
+
+
+def _message_type_string(message_type) -> str:
+    """Convert a MessageType enum (or an existing string) to a GUI message type."""
+    if isinstance(message_type, str):
+        return message_type
+    
+    message_type_str = _MESSAGE_TYPE_STRINGS.get(message_type)
+    if message_type_str is None:
+        # Other members, or the enum loaded through another import path of the package
+        if hasattr(message_type, 'name'):
+            message_type_str = _MESSAGE_TYPE_NAMES.get(message_type.name, 'public')
+        else:
+            message_type_str = str(message_type)
+    return message_type_str
+
+
+def _intern_name(name):
+    """Intern a user name so every message from one user shares a single string."""
+    return sys.intern(name) if type(name) is str else name
+
+
+def _chat_message_data(message: ChatMessage) -> Dict[str, Any]:
+    """Convert a ChatMessage to event data by reading its fields directly."""
+    data = message.data
+    return {
+        "content": data['content'],
+        "sender": _intern_name(message.sender),
+        "message_type": _message_type_string(message.message_type),
+        "is_private": data['is_private'],
+        "recipient": _intern_name(message.recipient),
+        "timestamp": message.timestamp
+    }
+
+
+def _generic_message_data(message) -> Dict[str, Any]:
+    """Convert any other message object, preferring attributes over its data dict."""
+    try:
+        # Chat-like objects expose every field as an attribute
+        content, sender = message.content, message.sender
+        message_type, is_private, recipient = message.message_type, message.is_private, message.recipient
+    except AttributeError:
+        data_get = (getattr(message, 'data', None) or {}).get
+        
+        def field(name, default):
+            value = getattr(message, name, _MISSING)
+            return data_get(name, default) if value is _MISSING else value
+        
+        content = field('content', 'Unknown message')
+        sender = field('sender', 'Unknown')
+        message_type = field('message_type', 'public')
+        is_private = field('is_private', False)
+        recipient = field('recipient', None)
+    
+    return {
+        "content": content,
+        "sender": _intern_name(sender),
+        "message_type": _message_type_string(message_type),
+        "is_private": is_private,
+        "recipient": _intern_name(recipient),
+        "timestamp": getattr(message, 'timestamp', None)
+    }
+
+
+def _safe(message: str):
+    """Log and swallow handler errors as '<message>: <error>'."""
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(self, *args):
+            try:
+                return handler(self, *args)
+            except Exception as e:
+                logger.error(f"{message}: {e}")
+        return wrapper
+    return decorator
+
+
+class _ClientSendSignals(QObject):
+    """Signals for reporting chat client send results from the send thread."""
+    
+    send_finished = Signal(str, bool)  # description, success
+
+
+class _ClientSendWorker(QRunnable):
+    """Run one blocking chat client send call off the GUI thread."""
+    
+    def __init__(self, description: str, send, *args):
+        super().__init__()
+        self.description = description
+        self.send = send
+        self.args = args
+        self.signals = _ClientSendSignals()
+    
+    def run(self) -> None:
+        """Perform the send and report whether it succeeded."""
+        try:
+            success = bool(self.send(*self.args))
+        except Exception as e:
+            logger.error(f"Error sending {self.description} to chat client: {e}")
+            success = False
+        self.signals.send_finished.emit(self.description, success)
+
+
+class GUIController(QObject):
     """Main controller for coordinating GUI components."""
     
+    # Component type -> class registered with the component registry
+    _COMPONENT_TYPES = {
+        "chat_context_manager": ChatContextManager,
+        "chat_display": ChatDisplay,
+        "message_input": MessageInput,
+        "file_transfer_input": FileTransferInput,
+        "user_list": UserList,
+        "notification_manager": NotificationManager,
+        "file_history": FileHistory,
+    }
+    
+    # Components in creation order (the managers are invisible)
+    _COMPONENT_IDS = (
+        "chat_context_manager",
+        "notification_manager",
+        "chat_display",
+        "message_input",
+        "file_transfer_input",
+        "user_list",
+        "file_history",
+    )
+    
+    # Components stacked top to bottom in the chat (left) and side (right) panels
+    _LEFT_PANEL = ("chat_display", "message_input", "file_transfer_input")
+    _RIGHT_PANEL = ("user_list", "file_history")
+    
+    # Component -> components it must be initialized after
+    _COMPONENT_DEPENDENCIES = {
+        "chat_context_manager": [],
+        "chat_display": ["chat_context_manager"],
+        "message_input": ["chat_context_manager"],
+        "file_transfer_input": ["chat_context_manager"],
+        "user_list": ["chat_context_manager"],
+        "file_history": [],
+    }
+    
+    # Chat client signal -> controller slot
+    _CLIENT_SIGNAL_MAP = (
+        ("message_received", "_on_message_received"),
+        ("user_list_updated", "_on_user_list_updated"),
+        ("system_message", "_on_system_message"),
+        ("error_occurred", "_on_error_occurred"),
+        ("connection_status_changed", "_on_connection_status_changed"),
+        ("file_transfer_request", "_on_file_transfer_request"),
+        ("file_transfer_progress_batch", "_on_file_transfer_progress_batch"),
+        ("file_transfer_complete", "_on_file_transfer_complete"),
+        ("file_list_received", "_on_file_list_received"),
+    )
+    
     def __init__(self, event_bus: EventBus, state_manager: StateManager):
         """
         Initialize GUI controller.
@@ -33,6 +220,9 @@ class GUIController:
             event_bus: Event bus instance
             state_manager: State manager instance
         """
+        # A QObject so chat client signals connect to real, typed slots
+        super().__init__()
+        
         self.event_bus = event_bus
         self.state_manager = state_manager
         self.component_registry = get_component_registry()
@@ -41,6 +231,33 @@ class GUIController:
         self._initialized = False
         self._chat_client = None
         
+        # Chat client methods, bound once in set_chat_client()
+        self._senders: Dict[str, Callable] = {}
+        self._send_file = None
+        self._accept_ft = None
+        self._decline_ft = None
+        
+        # Coalesce bursts of received messages into one event per frame
+        self._pending_messages: List[Dict[str, Any]] = []
+        self._message_flush_timer = QTimer(self)
+        self._message_flush_timer.setSingleShot(True)
+        self._message_flush_timer.setInterval(16)
+        self._message_flush_timer.timeout.connect(self._flush_received_messages)
+        
+        # Blocking client sends run on one dedicated thread, which keeps them in order
+        self._send_pool = QThreadPool(self)
+        self._send_pool.setMaxThreadCount(1)
+        self._send_workers = deque()
+        
+        # Last whole percent reported per transfer, for progress throttling
+        self._last_progress: Dict[str, int] = {}
+        
+        # Non-blocking message boxes currently on screen
+        self._message_boxes = set()
+        
+        # Chat client connections, released explicitly in cleanup()
+        self._connections: List[QMetaObject.Connection] = []
+        
         # Register component types
         self._register_component_types()
         
@@ -49,20 +266,15 @@ class GUIController:
     
     def _register_component_types(self) -> None:
         """Register all component types with the registry."""
-        self.component_registry.register_component_type("chat_context_manager", ChatContextManager)
-        self.component_registry.register_component_type("chat_display", ChatDisplay)
-        self.component_registry.register_component_type("message_input", MessageInput)
-        self.component_registry.register_component_type("file_transfer_input", FileTransferInput)
-        self.component_registry.register_component_type("user_list", UserList)
-        self.component_registry.register_component_type("notification_manager", NotificationManager)
-        self.component_registry.register_component_type("file_history", FileHistory)
+        self.component_registry.register_component_types(self._COMPONENT_TYPES)
         
         logger.debug("Registered component types")
     
     def _setup_event_handlers(self) -> None:
         """Set up event handlers for the GUI controller."""
-        self.event_bus.subscribe(ChatEvents.MESSAGE_SENT, self._handle_message_sent)
-        self.event_bus.subscribe(ChatEvents.FILE_TRANSFER_REQUESTED, self._handle_file_transfer_requested)
+        # Outgoing messages and file requests arrive through the input
+        # components' Qt signals (see _connect_component_signals), so the
+        # controller does not need an event bus hop for them.
         logger.debug("GUI controller event handlers set up")
     
     def create_main_window_components(self, parent_widget: QWidget) -> Dict[str, Any]:
@@ -76,57 +288,13 @@ class GUIController:
             Dictionary of created components
         """
         try:
-            # Create chat context manager (invisible component)
-            context_manager = self.component_registry.create_component(
-                "chat_context_manager",
-                "chat_context_manager",
-                parent_widget
-            )
-            self._components["chat_context_manager"] = context_manager
-            
-            # Create notification manager (invisible component)
-            notification_manager = self.component_registry.create_component(
-                "notification_manager",
-                "notification_manager",
-                parent_widget
-            )
-            self._components["notification_manager"] = notification_manager
+            # Invisible managers first, then the main UI components
+            create = self.component_registry.create_component
+            store = self._components
+            for component_id in self._COMPONENT_IDS:
+                store[component_id] = create(component_id, component_id, parent_widget)
             
-            # Create main UI components
-            chat_display = self.component_registry.create_component(
-                "chat_display",
-                "chat_display",
-                parent_widget
-            )
-            self._components["chat_display"] = chat_display
-            
-            message_input = self.component_registry.create_component(
-                "message_input",
-                "message_input",
-                parent_widget
-            )
-            self._components["message_input"] = message_input
-            
-            file_transfer_input = self.component_registry.create_component(
-                "file_transfer_input",
-                "file_transfer_input",
-                parent_widget
-            )
-            self._components["file_transfer_input"] = file_transfer_input
-            
-            user_list = self.component_registry.create_component(
-                "user_list",
-                "user_list",
-                parent_widget
-            )
-            self._components["user_list"] = user_list
-            
-            file_history = self.component_registry.create_component(
-                "file_history",
-                "file_history",
-                parent_widget
-            )
-            self._components["file_history"] = file_history
+            self._connect_component_signals()
             
             logger.info("Created main window components")
             return self._components
@@ -135,6 +303,16 @@ class GUIController:
             logger.error(f"Failed to create main window components: {e}")
             raise
     
+    def _connect_component_signals(self) -> None:
+        """Connect same-thread component signals directly to the controller."""
+        # Both sides live on the GUI thread, so skip the per-emit thread check
+        self._components["message_input"].message_sent.connect(
+            self._handle_message_sent, Qt.ConnectionType.DirectConnection
+        )
+        self._components["file_transfer_input"].file_transfer_requested.connect(
+            self._handle_file_transfer_requested, Qt.ConnectionType.DirectConnection
+        )
+    
     def initialize_components(self) -> bool:
         """
         Initialize all components.
@@ -165,23 +343,7 @@ class GUIController:
     
     def _setup_component_dependencies(self) -> None:
         """Set up component dependencies."""
-        # Chat context manager has no dependencies
-        self.component_registry.set_component_dependencies("chat_context_manager", [])
-        
-        # Chat display depends on context manager
-        self.component_registry.set_component_dependencies("chat_display", ["chat_context_manager"])
-        
-        # Message input depends on context manager
-        self.component_registry.set_component_dependencies("message_input", ["chat_context_manager"])
-        
-        # File transfer input depends on context manager
-        self.component_registry.set_component_dependencies("file_transfer_input", ["chat_context_manager"])
-        
-        # User list depends on context manager
-        self.component_registry.set_component_dependencies("user_list", ["chat_context_manager"])
-        
-        # File history has no dependencies
-        self.component_registry.set_component_dependencies("file_history", [])
+        self.component_registry.set_many_dependencies(self._COMPONENT_DEPENDENCIES)
     
     def setup_main_window_layout(self, parent_widget: QWidget) -> None:
         """
@@ -198,39 +360,38 @@ class GUIController:
             splitter = QSplitter(Qt.Orientation.Horizontal)
             main_layout.addWidget(splitter)
             
+            comps = self._components
+            
             # Left panel - Chat area
             chat_widget = QWidget()
             chat_layout = QVBoxLayout(chat_widget)
+            add_chat_widget = chat_layout.addWidget
             
-            # Add chat display
-            if "chat_display" in self._components:
-                chat_layout.addWidget(self._components["chat_display"])
-            
-            # Add message input
-            if "message_input" in self._components:
-                chat_layout.addWidget(self._components["message_input"])
-            
-            # Add file transfer input
-            if "file_transfer_input" in self._components:
-                chat_layout.addWidget(self._components["file_transfer_input"])
+            # Add chat display, message input and file transfer input
+            for component_id in self._LEFT_PANEL:
+                component = comps.get(component_id)
+                if component is not None:
+                    add_chat_widget(component)
             
             # Right panel - User list and File history
             right_widget = QWidget()
             right_layout = QVBoxLayout(right_widget)
+            add_right_widget = right_layout.addWidget
             
-            # Add user list
-            if "user_list" in self._components:
-                right_layout.addWidget(self._components["user_list"])
-            
-            # Add file history
-            if "file_history" in self._components:
-                right_layout.addWidget(self._components["file_history"])
+            # Add user list and file history
+            for component_id in self._RIGHT_PANEL:
+                component = comps.get(component_id)
+                if component is not None:
+                    add_right_widget(component)
             
             # Add widgets to splitter
             splitter.addWidget(chat_widget)
             splitter.addWidget(right_widget)
             splitter.setSizes([600, 300])  # Increased right panel size for file history
             
+            # Build the file transfer dialog now so the first request shows instantly
+            FileTransferDialog.prewarm()
+            
             logger.info("Set up main window layout")
             
         except Exception as e:
@@ -246,12 +407,27 @@ class GUIController:
             username: Current username
         """
         try:
-            # Store chat client reference
+            # Store chat client reference and bind the methods used per action
             self._chat_client = chat_client
+            send_public = chat_client.send_public_message
+            send_private = chat_client.send_private_message
+            # Message type -> (content, recipient) -> (send method, args), or None
+            # when the message cannot be sent
+            self._senders = {
+                "public": lambda content, _: (send_public, (content,)),
+                "private": lambda content, recipient: (
+                    (send_private, (content, recipient)) if recipient else None
+                ),
+            }
+            self._send_file = chat_client.send_file
+            self._accept_ft = chat_client.accept_file_transfer
+            self._decline_ft = chat_client.decline_file_transfer
             
-            # Set initial state
-            self.state_manager.set_state(StateKeys.CURRENT_USER, username, "gui_controller")
-            self.state_manager.set_state(StateKeys.CONNECTION_STATUS, True, "gui_controller")
+            # Set initial state in one locked pass
+            self.state_manager.update_state({
+                StateKeys.CURRENT_USER: username,
+                StateKeys.CONNECTION_STATUS: True,
+            }, _SOURCE)
             
             # Connect chat client signals to event bus
             self._connect_chat_client_signals(chat_client)
@@ -269,166 +445,147 @@ class GUIController:
     def _connect_chat_client_signals(self, chat_client) -> None:
         """Connect chat client signals to event bus."""
         try:
-            # Message signals
-            chat_client.message_received.connect(self._on_message_received)
-            chat_client.user_list_updated.connect(self._on_user_list_updated)
-            chat_client.system_message.connect(self._on_system_message)
-            chat_client.error_occurred.connect(self._on_error_occurred)
-            chat_client.connection_status_changed.connect(self._on_connection_status_changed)
-            
-            # File transfer signals (if available)
-            if hasattr(chat_client, 'file_transfer_request'):
-                chat_client.file_transfer_request.connect(self._on_file_transfer_request)
-            if hasattr(chat_client, 'file_transfer_progress'):
-                chat_client.file_transfer_progress.connect(self._on_file_transfer_progress)
-            if hasattr(chat_client, 'file_transfer_complete'):
-                chat_client.file_transfer_complete.connect(self._on_file_transfer_complete)
-            if hasattr(chat_client, 'file_list_received'):
-                chat_client.file_list_received.connect(self._on_file_list_received)
+            # The client emits from its receive thread, so always queue onto the
+            # GUI thread explicitly instead of resolving it per emit
+            queued = Qt.ConnectionType.QueuedConnection
+            
+            # A reconnect replaces the previous client rather than adding to it
+            self._disconnect_chat_client_signals()
+            
+            # File transfer signals are optional, so missing ones are skipped.
+            # Slots on this QObject are not kept alive by the client; the handles
+            # let cleanup() cut the client off before the controller is collected
+            connections = self._connections
+            for signal_name, slot_name in self._CLIENT_SIGNAL_MAP:
+                signal = getattr(chat_client, signal_name, None)
+                if signal is not None:
+                    connections.append(signal.connect(getattr(self, slot_name), queued))
             
             logger.debug("Connected chat client signals")
             
         except Exception as e:
             logger.error(f"Failed to connect chat client signals: {e}")
     
+    def _disconnect_chat_client_signals(self) -> None:
+        """Disconnect every chat client signal connected by this controller."""
+        for connection in self._connections:
+            QObject.disconnect(connection)
+        self._connections.clear()
+    
+    @Slot(object)
     def _on_message_received(self, message) -> None:
         """Handle message received from chat client."""
+        # Only the conversion touches foreign objects; the rest cannot fail
         try:
-            # Convert message to event data
-            message_type = getattr(message, 'message_type', message.data.get('message_type', 'public'))
-            
-            # Convert MessageType enum to string for GUI components
-            if hasattr(message_type, 'name'):
-                # It's a MessageType enum
-                if message_type.name == 'PUBLIC_MESSAGE':
-                    message_type_str = 'public'
-                elif message_type.name == 'PRIVATE_MESSAGE':
-                    message_type_str = 'private'
-                else:
-                    message_type_str = 'public'  # Default fallback
+            # Chat messages take a direct-attribute fast path
+            if isinstance(message, ChatMessage):
+                message_data = _chat_message_data(message)
             else:
-                # It's already a string
-                message_type_str = str(message_type)
-            
-            # Also check for is_private flag in message data
-            is_private = getattr(message, 'is_private', message.data.get('is_private', False))
-            recipient = getattr(message, 'recipient', message.data.get('recipient', None))
-            
-            message_data = {
-                "content": getattr(message, 'content', message.data.get('content', 'Unknown message')),
-                "sender": getattr(message, 'sender', message.data.get('sender', 'Unknown')),
-                "message_type": message_type_str,
-                "is_private": is_private,
-                "recipient": recipient,
-                "timestamp": getattr(message, 'timestamp', None)
-            }
-            
-            logger.info(f"🎯 GUI Controller: Received {message_data['message_type']} message from {message_data['sender']}: {message_data['content'][:50]}...")
-            logger.info(f"🎯 GUI Controller: Message details - is_private: {message_data['is_private']}, recipient: {message_data['recipient']}")
-            
-            # Publish message received event
-            self.event_bus.publish(Event(
-                event_type=ChatEvents.MESSAGE_RECEIVED,
-                data={"message": message_data},
-                source="gui_controller"
-            ))
-            
-            logger.debug(f"GUI Controller: Published MESSAGE_RECEIVED event for {message_data['message_type']} message from {message_data['sender']}")
-            
-        except Exception as e:
+                message_data = _generic_message_data(message)
+        except (AttributeError, KeyError) as e:
             logger.error(f"Error handling message received: {e}")
+            return
+        
+        # Per-message tracing stays at DEBUG so a busy chat does not flood the log
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🎯 GUI Controller: Received %s message from %s: %.50s...",
+                         message_data['message_type'], message_data['sender'], message_data['content'])
+            logger.debug("🎯 GUI Controller: Message details - is_private: %s, recipient: %s",
+                         message_data['is_private'], message_data['recipient'])
+        
+        # Queue for the next batched MESSAGE_RECEIVED_BATCH event
+        self._pending_messages.append(message_data)
+        if len(self._pending_messages) >= _MESSAGE_BATCH_LIMIT:
+            self._flush_received_messages()  # Bound latency during floods
+        elif not self._message_flush_timer.isActive():
+            self._message_flush_timer.start()
+    
+    @Slot()
+    def _flush_received_messages(self) -> None:
+        """Publish all queued received messages as a single batch event."""
+        self._message_flush_timer.stop()
+        if not self._pending_messages:
+            return
+        
+        messages = self._pending_messages
+        self._pending_messages = []
+        
+        self.event_bus.publish_fast(ChatEvents.MESSAGE_RECEIVED_BATCH, _SOURCE, messages=messages)
+        
+        logger.debug("GUI Controller: Published MESSAGE_RECEIVED_BATCH event with %d messages", len(messages))
     
+    @Slot(list)
+    @_safe("Error handling user list update")
     def _on_user_list_updated(self, users: List[str]) -> None:
         """Handle user list update from chat client."""
-        try:
-            # Update state
-            self.state_manager.set_state(StateKeys.USER_LIST, users, "gui_controller")
-            
-            # Publish user list updated event
-            self.event_bus.publish(Event(
-                event_type=ChatEvents.USER_LIST_UPDATED,
-                data={"users": users},
-                source="gui_controller"
-            ))
-            
-        except Exception as e:
-            logger.error(f"Error handling user list update: {e}")
+        # One frozen roster shared by the state and the event; deep copies of a
+        # tuple of strings return the tuple itself, so consumers copy nothing
+        users = tuple(users)
+        
+        # Update state
+        self.state_manager.set_state(StateKeys.USER_LIST, users, _SOURCE)
+        
+        # Publish user list updated event
+        self.event_bus.publish_fast(ChatEvents.USER_LIST_UPDATED, _SOURCE, users=users)
     
+    @Slot(str)
+    @_safe("Error handling system message")
     def _on_system_message(self, message: str) -> None:
         """Handle system message from chat client."""
-        try:
-            # Publish system message event
-            self.event_bus.publish(Event(
-                event_type=ChatEvents.SYSTEM_MESSAGE,
-                data={"message": message},
-                source="gui_controller"
-            ))
-            
-        except Exception as e:
-            logger.error(f"Error handling system message: {e}")
+        # Publish system message event
+        self.event_bus.publish_fast(ChatEvents.SYSTEM_MESSAGE, _SOURCE, message=message)
     
+    @Slot(str)
+    @_safe("Error handling error")
     def _on_error_occurred(self, error_message: str) -> None:
         """Handle error from chat client."""
-        try:
-            # Update state
-            self.state_manager.set_state(StateKeys.CONNECTION_ERROR, error_message, "gui_controller")
-            
-            # Publish error event
-            self.event_bus.publish(Event(
-                event_type=ChatEvents.ERROR_OCCURRED,
-                data={"error": error_message},
-                source="gui_controller"
-            ))
-            
-        except Exception as e:
-            logger.error(f"Error handling error: {e}")
+        # Update state
+        self.state_manager.set_state(StateKeys.CONNECTION_ERROR, error_message, _SOURCE)
+        
+        # Publish error event
+        self.event_bus.publish_fast(ChatEvents.ERROR_OCCURRED, _SOURCE, error=error_message)
     
+    @Slot(bool)
+    @_safe("Error handling connection status change")
     def _on_connection_status_changed(self, connected: bool) -> None:
         """Handle connection status change from chat client."""
-        try:
-            # Update state
-            self.state_manager.set_state(StateKeys.CONNECTION_STATUS, connected, "gui_controller")
-            
-            # Publish connection status changed event
-            self.event_bus.publish(Event(
-                event_type=ChatEvents.CONNECTION_STATUS_CHANGED,
-                data={"connected": connected},
-                source="gui_controller"
-            ))
-            
-        except Exception as e:
-            logger.error(f"Error handling connection status change: {e}")
+        # Update state
+        self.state_manager.set_state(StateKeys.CONNECTION_STATUS, connected, _SOURCE)
+        
+        # Publish connection status changed event
+        self.event_bus.publish_fast(ChatEvents.CONNECTION_STATUS_CHANGED, _SOURCE, connected=connected)
     
+    @Slot(object)
     def _on_file_transfer_request(self, request) -> None:
         """Handle file transfer request by showing a dialog to the user."""
         try:
-            from ..components.dialogs.file_transfer_dialog import FileTransferDialog
-            
             filename = getattr(request, 'filename', None) or request.data.get('filename', 'Unknown file')
             sender = getattr(request, 'sender', None) or request.data.get('sender', 'Unknown user')
             transfer_id = getattr(request, 'transfer_id', None) or getattr(request, 'message_id', None)
             
             # Friendly human-readable size if available
             file_size = getattr(request, 'file_size', None) or request.data.get('file_size')
-            def _hr_size(n):
-                try:
-                    n = int(n)
-                except Exception:
-                    return ''
-                for unit in ['B','KB','MB','GB']:
-                    if n < 1024.0:
-                        return f"{n:.1f}{unit}"
-                    n /= 1024.0
-                return f"{n:.1f}TB"
-            
-            size_text = _hr_size(file_size) if file_size else None
-            
-            # Create and show dialog
-            dialog = FileTransferDialog(filename, sender, size_text)
-            if dialog.exec_() == FileTransferDialog.Accepted:
+            size_text = format_file_size(file_size) if file_size else None
+            
+            # Show the shared, pre-warmed dialog without blocking; queued chat
+            # signals keep being delivered while the user decides
+            FileTransferDialog.ask(
+                filename, sender, size_text,
+                functools.partial(self._finalize_file_request, transfer_id, filename=filename, sender=sender)
+            )
+            
+        except Exception as e:
+            logger.error(f"Error handling file transfer request: {e}")
+            self._on_error_occurred(f"Error handling file transfer request: {e}")
+    
+    def _finalize_file_request(self, transfer_id: Optional[str], accepted: bool,
+                               filename: str, sender: str) -> None:
+        """Accept or decline a file transfer once the user has answered."""
+        try:
+            if accepted:
                 # User clicked Accept
-                if transfer_id and self._chat_client:
-                    ok = self._chat_client.accept_file_transfer(transfer_id)
+                if transfer_id and self._accept_ft is not None:
+                    ok = self._accept_ft(transfer_id)
                     if ok:
                         self._on_system_message(f"📥 Accepted file: {filename} from {sender}")
                     else:
@@ -437,131 +594,118 @@ class GUIController:
                     self._on_error_occurred("Missing transfer id for file transfer request")
             else:
                 # User clicked Decline
-                if transfer_id and self._chat_client:
-                    self._chat_client.decline_file_transfer(transfer_id, "Declined by user")
+                if transfer_id and self._decline_ft is not None:
+                    self._decline_ft(transfer_id, "Declined by user")
                     self._on_system_message(f"❌ Declined file: {filename} from {sender}")
                 else:
                     self._on_system_message(f"❌ Declined file request from {sender} (no id)")
             
-            print(f"🔥 DEBUG: GUI CONTROLLER - File transfer request handled: {filename} from {sender}")
+            logger.debug(f"File transfer request handled: {filename} from {sender}")
             
         except Exception as e:
             logger.error(f"Error handling file transfer request: {e}")
             self._on_error_occurred(f"Error handling file transfer request: {e}")
-            
-        except Exception as e:
-            logger.error(f"Error handling file transfer request: {e}")
     
-    def _on_file_transfer_progress(self, transfer_id: str, current: int, total: int) -> None:
-        """Handle file transfer progress."""
-        progress_percent = (current / total * 100) if total > 0 else 0
-        logger.debug(f"File transfer progress: {transfer_id} - {progress_percent:.1f}% ({current}/{total})")
+    def _show_warning(self, title: str, text: str) -> None:
+        """Show a warning box without blocking the event loop."""
+        box = QMessageBox(QMessageBox.Icon.Warning, title, text)
+        # Parentless, so keep the box referenced until the user closes it
+        self._message_boxes.add(box)
+        box.finished.connect(lambda _result: self._message_boxes.discard(box))
+        box.open()
     
+    @Slot(list)
+    def _on_file_transfer_progress_batch(self, updates: List[tuple]) -> None:
+        """Handle a batch of (transfer_id, current, total) progress updates."""
+        last_progress = self._last_progress
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for transfer_id, current, total in updates:
+            # Only whole-percent steps (and the final chunk) go any further
+            percent = current * 100 // total if total > 0 else 0
+            if percent <= last_progress.get(transfer_id, -1) and current != total:
+                continue
+            last_progress[transfer_id] = percent
+            
+            if debug:
+                logger.debug("File transfer progress: %s - %d%% (%d/%d)", transfer_id, percent, current, total)
+    
+    @Slot(str, bool, str)
+    @_safe("Error handling file transfer completion")
     def _on_file_transfer_complete(self, transfer_id: str, success: bool, file_path: str) -> None:
         """Handle file transfer completion."""
-        try:
-            from PySide6.QtWidgets import QMessageBox
-            import os
-            
-            if success and file_path:
-                # Check if this is an outgoing transfer (file we sent)
-                if file_path.startswith("outgoing:"):
-                    logger.info(f"File transfer completed successfully (outgoing): {transfer_id}")
-                    
-                    # Show system message
-                    self.event_bus.publish(Event(
-                        event_type=ChatEvents.SYSTEM_MESSAGE,
-                        data={"message": f"✅ File sent successfully"},
-                        source="gui_controller"
-                    ))
-                    
-                    # Publish file transfer complete event for components to handle
-                    self.event_bus.publish(Event(
-                        event_type=ChatEvents.FILE_TRANSFER_COMPLETE,
-                        data={
-                            "transfer_id": transfer_id,
-                            "success": success,
-                            "file_path": file_path
-                        },
-                        source="gui_controller"
-                    ))
-                else:
-                    # This is an incoming transfer (file we received)
-                    filename = os.path.basename(file_path)
-                    logger.info(f"File transfer completed successfully: {filename}")
-                    
-                    # Show system message
-                    self.event_bus.publish(Event(
-                        event_type=ChatEvents.SYSTEM_MESSAGE,
-                        data={"message": f"✅ File transfer completed: {filename}"},
-                        source="gui_controller"
-                    ))
-                    
-                    # Publish file transfer complete event for components to handle
-                    print(f"🔥 DEBUG: PUBLISHING FILE_TRANSFER_COMPLETE EVENT FOR: {filename}")
-                    self.event_bus.publish(Event(
-                        event_type=ChatEvents.FILE_TRANSFER_COMPLETE,
-                        data={
-                            "transfer_id": transfer_id,
-                            "success": success,
-                            "file_path": file_path
-                        },
-                        source="gui_controller"
-                    ))
-                    
-                    # File transfer completed successfully - no dialog needed
-                    # Users can open files from the received files box if they want
-                    logger.info(f"File transfer completed successfully: {filename}")
-            else:
-                logger.error(f"File transfer failed: {transfer_id}")
+        self._last_progress.pop(transfer_id, None)
+        
+        if success and file_path:
+            # Check if this is an outgoing transfer (file we sent)
+            if file_path.startswith("outgoing:"):
+                logger.info(f"File transfer completed successfully (outgoing): {transfer_id}")
                 
                 # Show system message
-                self.event_bus.publish(Event(
-                    event_type=ChatEvents.SYSTEM_MESSAGE,
-                    data={"message": f"❌ File transfer failed: {transfer_id}"},
-                    source="gui_controller"
-                ))
+                self.event_bus.publish_fast(ChatEvents.SYSTEM_MESSAGE, _SOURCE, message=f"✅ File sent successfully")
+                
+                # Publish file transfer complete event for components to handle
+                self.event_bus.publish_fast(
+                    ChatEvents.FILE_TRANSFER_COMPLETE,
+                    _SOURCE,
+                    transfer_id=transfer_id,
+                    success=success,
+                    file_path=file_path
+                )
+            else:
+                # This is an incoming transfer (file we received)
+                filename = os.path.basename(file_path)
+                logger.info(f"File transfer completed successfully: {filename}")
                 
-                # Publish file transfer complete event for components to handle (even for failures)
-                self.event_bus.publish(Event(
-                    event_type=ChatEvents.FILE_TRANSFER_COMPLETE,
-                    data={
-                        "transfer_id": transfer_id,
-                        "success": success,
-                        "file_path": file_path
-                    },
-                    source="gui_controller"
-                ))
+                # Show system message
+                self.event_bus.publish_fast(ChatEvents.SYSTEM_MESSAGE, _SOURCE, message=f"✅ File transfer completed: {filename}")
                 
-                QMessageBox.warning(
-                    None,
-                    "File Transfer Failed",
-                    f"File transfer failed: {file_path if not success else 'Unknown error'}"
+                # Publish file transfer complete event for components to handle
+                logger.debug(f"Publishing file transfer complete event for: {filename}")
+                self.event_bus.publish_fast(
+                    ChatEvents.FILE_TRANSFER_COMPLETE,
+                    _SOURCE,
+                    transfer_id=transfer_id,
+                    success=success,
+                    file_path=file_path
                 )
                 
-        except Exception as e:
-            logger.error(f"Error handling file transfer completion: {e}")
+                # File transfer completed successfully - no dialog needed
+                # Users can open files from the received files box if they want
+                logger.info(f"File transfer completed successfully: {filename}")
+        else:
+            logger.error(f"File transfer failed: {transfer_id}")
+            
+            # Show system message
+            self.event_bus.publish_fast(ChatEvents.SYSTEM_MESSAGE, _SOURCE, message=f"❌ File transfer failed: {transfer_id}")
+            
+            # Publish file transfer complete event for components to handle (even for failures)
+            self.event_bus.publish_fast(
+                ChatEvents.FILE_TRANSFER_COMPLETE,
+                _SOURCE,
+                transfer_id=transfer_id,
+                success=success,
+                file_path=file_path
+            )
+            
+            self._show_warning(
+                "File Transfer Failed",
+                f"File transfer failed: {file_path if not success else 'Unknown error'}"
+            )
     
+    @Slot(list)
     def _on_file_list_received(self, file_list: List[Dict[str, Any]]) -> None:
         """Handle file list received."""
-        logger.debug(f"File list received: {len(file_list)} files")
+        logger.debug("File list received: %d files", len(file_list))
         
         # Publish file list received event for components to handle
-        self.event_bus.publish(Event(
-            event_type=ChatEvents.FILE_LIST_RECEIVED,
-            data={"files": file_list},
-            source="gui_controller"
-        ))
+        self.event_bus.publish_fast(ChatEvents.FILE_LIST_RECEIVED, _SOURCE, files=file_list)
     
     def _open_file(self, file_path: str) -> None:
         """Open a file with the default system application."""
         try:
-            import subprocess
-            import platform
-            
-            if platform.system() == 'Windows':
+            if _IS_WINDOWS:
                 os.startfile(file_path)
-            elif platform.system() == 'Darwin':  # macOS
+            elif _IS_MAC:
                 subprocess.run(['open', file_path])
             else:  # Linux and others
                 subprocess.run(['xdg-open', file_path])
@@ -570,88 +714,99 @@ class GUIController:
             
         except Exception as e:
             logger.error(f"Error opening file {file_path}: {e}")
-            from PySide6.QtWidgets import QMessageBox
-            QMessageBox.warning(
-                None,
+            self._show_warning(
                 "Error Opening File",
                 f"Could not open file: {e}"
             )
     
-    def _handle_message_sent(self, event: Event) -> None:
-        """Handle message sent event and send to chat client."""
-        try:
-            if not self._chat_client:
-                logger.error("Cannot send message: no chat client connected")
-                return
-            
-            message = event.data.get("message")
-            if not message:
-                logger.error("Cannot send message: no message data")
-                return
-            
-            # Extract message details
-            content = message.get("content", "")
-            message_type = message.get("message_type", "public")
-            recipient = message.get("recipient")
-            
-            logger.info(f"Sending {message_type} message: {content[:50]}...")
-            
-            # Send message to chat client
-            if message_type == "public":
-                # Send public message
-                self._chat_client.send_public_message(content)
-            elif message_type == "private" and recipient:
-                # Send private message
-                self._chat_client.send_private_message(content, recipient)
-            else:
-                logger.error(f"Cannot send message: invalid message type or missing recipient")
-                return
-            
-            logger.debug(f"Message sent successfully to chat client")
-            
-        except Exception as e:
-            logger.error(f"Error sending message to chat client: {e}")
+    @Slot(dict)
+    @_safe("Error sending message to chat client")
+    def _handle_message_sent(self, message: Dict[str, Any]) -> None:
+        """Handle a message sent from the message input and send to chat client."""
+        if not self._senders:
+            logger.error("Cannot send message: no chat client connected")
+            return
+        
+        if not message:
+            logger.error("Cannot send message: no message data")
+            return
+        
+        # Extract message details
+        content = message.get("content", "")
+        message_type = message.get("message_type", "public")
+        recipient = message.get("recipient")
+        
+        logger.info("Sending %s message: %.50s...", message_type, content)
+        
+        # Hand the message to the send thread so socket I/O never blocks the GUI
+        sender = self._senders.get(message_type)
+        call = sender(content, recipient) if sender is not None else None
+        if call is None:
+            logger.error(f"Cannot send message: invalid message type or missing recipient")
+            return
+        
+        send, args = call
+        self._start_send(f"{message_type} message", send, *args)
     
-    def _handle_file_transfer_requested(self, event: Event) -> None:
-        """Handle file transfer request event and send to chat client."""
-        try:
-            if not self._chat_client:
-                logger.error("Cannot send file: no chat client connected")
-                return
-            
-            file_data = event.data.get("file_data")
-            if not file_data:
-                logger.error("Cannot send file: no file data")
-                return
-            
-            # Extract file details
-            file_path = file_data.get("file_path", "")
-            filename = file_data.get("filename", "")
-            file_size = file_data.get("file_size", 0)
-            recipient = file_data.get("recipient", "")
-            is_private = file_data.get("is_private", True)
-            
-            logger.info(f"Sending file: {filename} ({file_size} bytes) to {recipient}")
-            
-            # Send file transfer request to chat client
-            if is_private and recipient != "GLOBAL":
-                # Send private file transfer
-                success = self._chat_client.send_file(file_path, recipient)
-            else:
-                # Send public file transfer
-                success = self._chat_client.send_file(file_path, "GLOBAL")
-            
-            if success:
-                logger.debug(f"File transfer request sent successfully")
-            else:
-                logger.error(f"Failed to send file transfer request")
-            
-        except Exception as e:
-            logger.error(f"Error sending file transfer request: {e}")
+    @Slot(dict)
+    @_safe("Error sending file transfer request")
+    def _handle_file_transfer_requested(self, file_data: Dict[str, Any]) -> None:
+        """Handle a file transfer request from the file input and send to chat client."""
+        if self._send_file is None:
+            logger.error("Cannot send file: no chat client connected")
+            return
+        
+        if not file_data:
+            logger.error("Cannot send file: no file data")
+            return
+        
+        # Extract file details
+        file_path = file_data.get("file_path", "")
+        filename = file_data.get("filename", "")
+        file_size = file_data.get("file_size", 0)
+        recipient = file_data.get("recipient", "")
+        is_private = file_data.get("is_private", True)
+        
+        logger.info(f"Sending file: {filename} ({file_size} bytes) to {recipient}")
+        
+        # Send file transfer request to chat client (hashing the file can take a while)
+        if is_private and recipient != "GLOBAL":
+            # Send private file transfer
+            self._start_send("file transfer request", self._send_file, file_path, recipient)
+        else:
+            # Send public file transfer
+            self._start_send("file transfer request", self._send_file, file_path, "GLOBAL")
+    
+    def _start_send(self, description: str, send, *args) -> None:
+        """Queue a blocking chat client call on the send thread."""
+        worker = _ClientSendWorker(description, send, *args)
+        # Reported from the send thread, so queue onto the GUI thread explicitly
+        worker.signals.send_finished.connect(self._on_send_finished, Qt.ConnectionType.QueuedConnection)
+        self._send_workers.append(worker)  # Keep the signals object alive until it reports
+        self._send_pool.start(worker)
+    
+    @Slot(str, bool)
+    def _on_send_finished(self, description: str, success: bool) -> None:
+        """Report the result of a background send."""
+        # A single send thread completes work in submission order
+        if self._send_workers:
+            self._send_workers.popleft()
+        
+        if success:
+            logger.debug("Sent %s to chat client", description)
+        else:
+            logger.error(f"Failed to send {description}")
     
     def cleanup(self) -> None:
         """Clean up the GUI controller and all components."""
         try:
+            self._disconnect_chat_client_signals()
+            
+            self._message_flush_timer.stop()
+            self._pending_messages.clear()
+            self._last_progress.clear()
+            self._send_pool.clear()  # Drop sends that have not started yet
+            
             if self._initialized:
                 # Clean up all components
                 self.component_registry.cleanup_all_components()
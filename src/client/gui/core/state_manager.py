@@ -2,17 +2,143 @@
 Centralized state management for the GUI application.
 """
 
-from typing import Dict, Any, Callable, Optional, List
+from typing import Dict, Any, Callable, Optional, List, FrozenSet, Iterable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
+from itertools import islice
 import logging
+import pickle
+import sys
 import threading
-from copy import deepcopy
+from collections import deque
+from contextlib import ExitStack
+from copy import copy, deepcopy
 
 logger = logging.getLogger(__name__)
 
+# Values of these types are immutable and never need cloning
+_ATOMIC_TYPES = frozenset((str, int, float, bool, type(None), bytes))
 
-@dataclass
+
+def _is_immutable(value: Any) -> bool:
+    """Check whether a value can be shared instead of copied."""
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES or isinstance(value, Enum):
+        return True
+    if value_type is tuple or value_type is frozenset:
+        # Only as immutable as their items
+        return all(_is_immutable(item) for item in value)
+    return False
+
+
+def _fast_clone(value: Any) -> Any:
+    """Return an independent copy of a state value, sharing it if immutable."""
+    if _is_immutable(value):
+        return value
+    try:
+        # A pickle round trip walks plain containers in C, far faster than deepcopy
+        return pickle.loads(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return deepcopy(value)  # Unpicklable values, e.g. some Qt objects
+
+
+class _Guard:
+    """Context manager running an acquire/release pair."""
+    
+    __slots__ = ("_acquire", "_release")
+    
+    def __init__(self, acquire: Callable[[], None], release: Callable[[], None]):
+        self._acquire = acquire
+        self._release = release
+    
+    def __enter__(self) -> None:
+        self._acquire()
+    
+    def __exit__(self, *exc_info) -> None:
+        self._release()
+
+
+class _RWLock:
+    """
+    Reader-writer lock letting concurrent readers in while writers are exclusive.
+    
+    Both sides are re-entrant: a reading thread may read again and the writing
+    thread may read or write again. Waiting writers block new readers so a
+    steady stream of reads cannot starve them; a thread already reading still
+    gets in, since it would otherwise wait on a writer that waits on it.
+    Upgrading a read to a write would deadlock and raises RuntimeError.
+    """
+    
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0  # Threads holding the read side
+        self._read_depth = threading.local()  # Per-thread read nesting
+        self._writer: Optional[int] = None
+        self._write_depth = 0
+        self._waiting_writers = 0
+        self.read_lock = _Guard(self.acquire_read, self.release_read)
+        self.write_lock = _Guard(self.acquire_write, self.release_write)
+    
+    def acquire_read(self) -> None:
+        depth = getattr(self._read_depth, "value", 0)
+        if depth:
+            self._read_depth.value = depth + 1
+            return
+        
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            while self._writer is not None or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        self._read_depth.value = 1
+    
+    def release_read(self) -> None:
+        depth = getattr(self._read_depth, "value", 0)
+        if depth > 1:
+            self._read_depth.value = depth - 1
+            return
+        
+        with self._cond:
+            if not depth:
+                # Read taken while holding the write side
+                self._write_depth -= 1
+                return
+            self._read_depth.value = 0
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+    
+    def acquire_write(self) -> None:
+        if getattr(self._read_depth, "value", 0):
+            raise RuntimeError("Cannot upgrade a read lock to a write lock")
+        
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._write_depth = 1
+    
+    def release_write(self) -> None:
+        with self._cond:
+            self._write_depth -= 1
+            if not self._write_depth:
+                self._writer = None
+                self._cond.notify_all()
+
+
+@dataclass(slots=True)
 class StateChange:
     """Represents a state change event."""
     key: str
@@ -20,18 +146,103 @@ class StateChange:
     new_value: Any
     timestamp: datetime = field(default_factory=datetime.now)
     source: str = None
+    
+    def __copy__(self) -> "StateChange":
+        new = object.__new__(self.__class__)
+        new.key = self.key
+        new.old_value = self.old_value
+        new.new_value = self.new_value
+        new.timestamp = self.timestamp
+        new.source = self.source
+        return new
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "StateChange":
+        # Key, timestamp and source are immutable; only the values need copying
+        new = object.__new__(self.__class__)
+        memo[id(self)] = new
+        new.key = self.key
+        new.old_value = deepcopy(self.old_value, memo)
+        new.new_value = deepcopy(self.new_value, memo)
+        new.timestamp = self.timestamp
+        new.source = self.source
+        return new
+
+
+class _Shard:
+    """One partition of the state, with its own lock."""
+    
+    __slots__ = ("state", "subscribers", "lock")
+    
+    def __init__(self):
+        self.state: Dict[str, Any] = {}
+        self.subscribers: Dict[str, List[Callable]] = {}
+        self.lock = _RWLock()
 
 
 class StateManager:
     """Centralized state management with change notifications."""
     
+    # Keys are spread over this many independently locked shards (power of two)
+    _SHARD_COUNT = 8
+    
     def __init__(self):
-        self._state: Dict[str, Any] = {}
-        self._subscribers: Dict[str, List[Callable]] = {}
-        self._change_history: List[StateChange] = []
+        # Writers to unrelated keys (e.g. splitter sizes and connection status)
+        # don't contend for one lock
+        self._shards = tuple(_Shard() for _ in range(self._SHARD_COUNT))
         self._max_history = 1000
-        self._lock = threading.RLock()  # Thread-safe access
+        # Ring buffer: old entries drop off the front as new ones are appended
+        self._change_history: deque = deque(maxlen=self._max_history)
+        self._lock = threading.Lock()  # Guards the history and copy-on-write keys
+        # Keys whose values share their contents (copy-on-write) instead of being cloned;
+        # replaced rather than mutated, so readers need no lock
+        self._shared_keys: FrozenSet[str] = frozenset()
+        
+    def _shard(self, key: str) -> _Shard:
+        """Get the shard holding a key."""
+        return self._shards[hash(key) & (self._SHARD_COUNT - 1)]
+    
+    def _lock_shards(self, keys: Optional[Iterable[str]] = None, write: bool = True) -> ExitStack:
+        """
+        Lock the shards holding some keys, always in shard order to avoid deadlocks.
         
+        Args:
+            keys: Keys whose shards to lock (None for all shards)
+            write: Take the exclusive side of the locks instead of the shared one
+            
+        Returns:
+            Context manager holding the locks
+        """
+        if keys is None:
+            shards = self._shards
+        else:
+            mask = self._SHARD_COUNT - 1
+            shards = [self._shards[i] for i in sorted({hash(key) & mask for key in keys})]
+        
+        stack = ExitStack()
+        for shard in shards:
+            stack.enter_context(shard.lock.write_lock if write else shard.lock.read_lock)
+        return stack
+    
+    def register_cow(self, key: str) -> None:
+        """
+        Store values under a key copy-on-write instead of cloning them.
+        
+        Only the top-level container is copied and its contents are shared, so
+        writers must publish new inner containers rather than mutate stored ones.
+        Meant for large, frequently replaced values such as chat histories.
+        
+        Args:
+            key: State key
+        """
+        with self._lock:
+            self._shared_keys = self._shared_keys | {key}
+    
+    def _clone(self, key: str, value: Any) -> Any:
+        """Copy a value for storage under a key."""
+        if key in self._shared_keys:
+            return value if _is_immutable(value) else copy(value)
+        return _fast_clone(value)
+    
     def get_state(self, key: str, default: Any = None) -> Any:
         """
         Get state value by key.
@@ -43,8 +254,9 @@ class StateManager:
         Returns:
             State value or default
         """
-        with self._lock:
-            return self._state.get(key, default)
+        shard = self._shard(key)
+        with shard.lock.read_lock:
+            return shard.state.get(key, default)
     
     def set_state(self, key: str, value: Any, source: str = None) -> None:
         """
@@ -55,26 +267,31 @@ class StateManager:
             value: New value
             source: Source of the change (for debugging)
         """
-        with self._lock:
-            old_value = self._state.get(key)
+        shard = self._shard(key)
+        change = None
+        with shard.lock.write_lock:
+            old_value = shard.state.get(key)
             
-            # Only update if value actually changed
-            if old_value != value:
-                self._state[key] = deepcopy(value)  # Store deep copy
+            # Only update if value actually changed; identity skips a deep compare
+            if old_value is not value and old_value != value:
+                stored = shard.state[key] = self._clone(key, value)  # Store independent copy
                 
-                # Record change
+                # Record change; the stored copy is already private, so share it
                 change = StateChange(
                     key=key,
                     old_value=old_value,
-                    new_value=deepcopy(value),
+                    new_value=stored,
                     source=source
                 )
                 self._add_to_history(change)
-                
-                # Notify subscribers
-                self._notify_subscribers(change)
-                
-                logger.debug(f"State changed: {key} = {value} (source: {source})")
+                callbacks = self._callbacks(key)
+        
+        if change is not None:
+            # Notify outside the lock so slow callbacks don't hold up other writers
+            self._notify_subscribers(change, callbacks)
+            
+            # Lazy formatting: large values are only rendered when DEBUG is on
+            logger.debug("State changed: %s = %s (source: %s)", key, value, source)
     
     def update_state(self, updates: Dict[str, Any], source: str = None) -> None:
         """
@@ -84,18 +301,19 @@ class StateManager:
             updates: Dictionary of key-value pairs to update
             source: Source of the change
         """
-        with self._lock:
+        with self._lock_shards(updates):
             changes = []
             
             for key, value in updates.items():
-                old_value = self._state.get(key)
-                if old_value != value:
-                    self._state[key] = deepcopy(value)
+                shard = self._shard(key)
+                old_value = shard.state.get(key)
+                if old_value is not value and old_value != value:
+                    stored = shard.state[key] = self._clone(key, value)
                     
                     change = StateChange(
                         key=key,
                         old_value=old_value,
-                        new_value=deepcopy(value),
+                        new_value=stored,
                         source=source
                     )
                     changes.append(change)
@@ -104,12 +322,14 @@ class StateManager:
             for change in changes:
                 self._add_to_history(change)
             
-            # Notify subscribers for each change
-            for change in changes:
-                self._notify_subscribers(change)
-            
-            if changes:
-                logger.debug(f"Batch state update: {len(changes)} changes (source: {source})")
+            pending = [(change, self._callbacks(change.key)) for change in changes]
+        
+        # Notify subscribers for each change, outside the lock
+        for change, callbacks in pending:
+            self._notify_subscribers(change, callbacks)
+        
+        if changes:
+            logger.debug(f"Batch state update: {len(changes)} changes (source: {source})")
     
     def subscribe_to_state(self, key: str, callback: Callable[[StateChange], None]) -> None:
         """
@@ -119,10 +339,11 @@ class StateManager:
             key: State key to monitor
             callback: Function to call when state changes
         """
-        with self._lock:
-            if key not in self._subscribers:
-                self._subscribers[key] = []
-            self._subscribers[key].append(callback)
+        shard = self._shard(key)
+        with shard.lock.write_lock:
+            if key not in shard.subscribers:
+                shard.subscribers[key] = []
+            shard.subscribers[key].append(callback)
         
         logger.debug(f"Subscribed to state changes for key: {key}")
     
@@ -134,10 +355,11 @@ class StateManager:
             key: State key
             callback: Function to remove from subscribers
         """
-        with self._lock:
-            if key in self._subscribers:
+        shard = self._shard(key)
+        with shard.lock.write_lock:
+            if key in shard.subscribers:
                 try:
-                    self._subscribers[key].remove(callback)
+                    shard.subscribers[key].remove(callback)
                 except ValueError:
                     logger.warning(f"Callback not found in subscribers for key: {key}")
         
@@ -145,13 +367,25 @@ class StateManager:
     
     def get_full_state(self) -> Dict[str, Any]:
         """
-        Get a deep copy of the entire state.
+        Get a copy of the entire state.
+        
+        Values are deep copies, except those under copy-on-write keys (see
+        register_cow), which are shallow copies sharing their contents.
         
         Returns:
-            Deep copy of all state
+            Copy of all state
         """
-        with self._lock:
-            return deepcopy(self._state)
+        with self._lock_shards(write=False):
+            state = {}
+            for shard in self._shards:
+                state.update(shard.state)
+            
+            shared = {key: copy(state.pop(key)) for key in self._shared_keys if key in state}
+            
+            # One clone of everything else instead of a copy per key
+            full_state = _fast_clone(state)
+            full_state.update(shared)
+            return full_state
     
     def clear_state(self, keys: Optional[List[str]] = None) -> None:
         """
@@ -160,32 +394,27 @@ class StateManager:
         Args:
             keys: List of keys to clear (None to clear all)
         """
-        with self._lock:
+        with self._lock_shards(keys):
+            changes = []
             if keys is None:
                 # Clear all state
-                changes = []
-                for key, value in self._state.items():
-                    change = StateChange(
-                        key=key,
-                        old_value=value,
-                        new_value=None,
-                        source="clear_all"
-                    )
-                    changes.append(change)
-                
-                self._state.clear()
-                
-                for change in changes:
-                    self._add_to_history(change)
-                    self._notify_subscribers(change)
-                
-                logger.debug("All state cleared")
+                for shard in self._shards:
+                    for key, value in shard.state.items():
+                        change = StateChange(
+                            key=key,
+                            old_value=value,
+                            new_value=None,
+                            source="clear_all"
+                        )
+                        changes.append(change)
+                    
+                    shard.state.clear()
             else:
                 # Clear specific keys
-                changes = []
                 for key in keys:
-                    if key in self._state:
-                        old_value = self._state.pop(key)
+                    shard = self._shard(key)
+                    if key in shard.state:
+                        old_value = shard.state.pop(key)
                         change = StateChange(
                             key=key,
                             old_value=old_value,
@@ -193,28 +422,36 @@ class StateManager:
                             source="clear_specific"
                         )
                         changes.append(change)
-                
-                for change in changes:
-                    self._add_to_history(change)
-                    self._notify_subscribers(change)
-                
-                if changes:
-                    logger.debug(f"Cleared state keys: {[c.key for c in changes]}")
+            
+            for change in changes:
+                self._add_to_history(change)
+            
+            pending = [(change, self._callbacks(change.key)) for change in changes]
+        
+        for change, callbacks in pending:
+            self._notify_subscribers(change, callbacks)
+        
+        if keys is None:
+            logger.debug("All state cleared")
+        elif changes:
+            logger.debug(f"Cleared state keys: {[c.key for c in changes]}")
     
-    def _notify_subscribers(self, change: StateChange) -> None:
-        """Notify all subscribers of a state change."""
-        if change.key in self._subscribers:
-            for callback in self._subscribers[change.key]:
-                try:
-                    callback(change)
-                except Exception as e:
-                    logger.error(f"Error in state change callback for {change.key}: {e}")
+    def _callbacks(self, key: str) -> Tuple[Callable, ...]:
+        """Snapshot a key's subscribers; the caller must hold its shard lock."""
+        return tuple(self._shard(key).subscribers.get(key, ()))
+    
+    def _notify_subscribers(self, change: StateChange, callbacks: Tuple[Callable, ...]) -> None:
+        """Notify subscribers of a state change."""
+        for callback in callbacks:
+            try:
+                callback(change)
+            except Exception as e:
+                logger.error(f"Error in state change callback for {change.key}: {e}")
     
     def _add_to_history(self, change: StateChange) -> None:
         """Add state change to history, maintaining size limit."""
-        self._change_history.append(change)
-        if len(self._change_history) > self._max_history:
-            self._change_history.pop(0)
+        with self._lock:
+            self._change_history.append(change)
     
     def get_change_history(self, key: Optional[str] = None, limit: int = 100) -> List[StateChange]:
         """
@@ -232,7 +469,9 @@ class StateManager:
             if key:
                 changes = [c for c in changes if c.key == key]
             
-            return changes[-limit:] if limit > 0 else changes
+            if limit <= 0:
+                return list(changes)
+            return list(islice(changes, max(0, len(changes) - limit), None))
     
     def clear_history(self) -> None:
         """Clear state change history."""
@@ -276,5 +515,12 @@ class StateKeys:
     DOWNLOADED_FILES = "file.downloads.list"
 
 
+# The dotted names are not interned automatically like identifier-style
+# literals; interning gives every key one shared object for dict lookups
+for _name, _value in list(vars(StateKeys).items()):
+    if not _name.startswith("_") and isinstance(_value, str):
+        setattr(StateKeys, _name, sys.intern(_value))
+
+
 # Global state manager instance
 state_manager = StateManager()
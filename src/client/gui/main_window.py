@@ -14,6 +14,7 @@ from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                QListWidgetItem)
 from PySide6.QtCore import Qt, Slot, QUrl
 from PySide6.QtGui import QFont, QColor, QDesktopServices, QTextCursor
+from src.utils.format_utils import format_file_size
 try:
     from ..chat_client import ChatClient
     from ...shared.messages.enums import MessageType
@@ -451,18 +452,7 @@ class MainWindow(QMainWindow):
 
         # Friendly human-readable size if available
         file_size = getattr(request, 'file_size', None) or request.data.get('file_size')
-        def _hr_size(n):
-            try:
-                n = int(n)
-            except Exception:
-                return ''
-            for unit in ['B','KB','MB','GB']:
-                if n < 1024.0:
-                    return f"{n:.1f}{unit}"
-                n /= 1024.0
-            return f"{n:.1f}TB"
-
-        size_text = f" ({_hr_size(file_size)})" if file_size else ''
+        size_text = f" ({format_file_size(file_size)})" if file_size else ''
 
         # Prompt user
         resp = QMessageBox.question(self, "File Transfer Request",
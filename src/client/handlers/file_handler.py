@@ -96,7 +96,7 @@ class FileHandler:
                     if transfer['total_chunks'] == 0:
                         self.client_core.file_transfer_manager.active_transfers[message.transfer_id]['total_chunks'] = message.total_chunks
                     
-                    self.client_core.signals.file_transfer_progress.emit(
+                    self.client_core.report_file_transfer_progress(
                         message.transfer_id, transfer['received_chunks'], message.total_chunks
                     )
                     
@@ -139,6 +139,7 @@ class FileHandler:
                     self.logger.info(f"📤 Received confirmation that sent file was completed: {message.transfer_id}")
             else:
                 self.logger.error(f"❌ File transfer failed: {message.transfer_id} - {message.error_message}")
+                self.client_core.flush_file_transfer_progress()
                 # Only show error to GUI if this user was involved in the transfer
                 if transfer:
                     self.client_core.signals.file_transfer_complete.emit(
@@ -224,11 +225,12 @@ class FileHandler:
                 
                 success = self.client_core.send_message(chunk_message)
                 if success:
-                    self.client_core.signals.file_transfer_progress.emit(
+                    self.client_core.report_file_transfer_progress(
                         transfer_id, chunk_index + 1, transfer['total_chunks']
                     )
                 else:
                     self.logger.error(f"Failed to send chunk {chunk_index}")
+                    self.client_core.flush_file_transfer_progress()
                     return
             
             complete_message = FileTransferComplete(
@@ -245,6 +247,7 @@ class FileHandler:
             self.client_core.file_transfer_manager.cleanup_transfer(transfer_id)
         except Exception as e:
             self.logger.error(f"Error sending file chunks: {e}")
+            self.client_core.flush_file_transfer_progress()
     
     def _complete_incoming_transfer(self, transfer_id: str):
         """Complete an incoming file transfer."""
@@ -0,0 +1,19 @@
+# utils/format_utils.py
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def format_file_size(size) -> str:
+    """
+    Format a byte count as a short human-readable size, e.g. "2.5MB".
+    Returns an empty string if the size is not a number.
+    """
+    try:
+        size = int(size)
+    except (TypeError, ValueError):
+        return ''
+
+    # Every unit spans 10 bits, so the bit length picks the unit without a loop;
+    # negative sizes stay in bytes
+    index = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) if size > 0 else 0
+    return f"{size / (1 << (10 * index)):.1f}{_SIZE_UNITS[index]}"
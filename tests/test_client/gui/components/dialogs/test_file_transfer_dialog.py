@@ -0,0 +1,68 @@
+# tests/test_client/gui/components/dialogs/test_file_transfer_dialog.py
+"""
+Unit tests for the FileTransferDialog request queue using unittest.
+"""
+
+import unittest
+import sys
+import os
+from PySide6.QtWidgets import QApplication
+
+# Adjust import path if needed
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from src.client.gui.components.dialogs import file_transfer_dialog
+from src.client.gui.components.dialogs.file_transfer_dialog import FileTransferDialog
+
+
+class TestFileTransferDialogQueue(unittest.TestCase):
+    """Unit tests for queued file transfer requests."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        file_transfer_dialog._pending_requests.clear()
+        self.dialog = FileTransferDialog.prewarm()
+
+    def tearDown(self):
+        self.dialog.hide()
+        file_transfer_dialog._pending_requests.clear()
+
+    def test_queued_requests_get_their_own_answers(self):
+        """Test each queued request is shown in turn and gets its own answer."""
+        answers = []
+        FileTransferDialog.ask("first.txt", "alice", on_answer=lambda ok: answers.append(("first", ok)))
+        FileTransferDialog.ask("second.txt", "bob", on_answer=lambda ok: answers.append(("second", ok)))
+
+        # Only the first request is on screen until it is answered
+        self.assertTrue(self.dialog.isVisible())
+        self.assertIn("first.txt", self.dialog._message_label.text())
+        self.assertEqual(answers, [])
+
+        self.dialog.accept()
+        self.assertEqual(answers, [("first", True)])
+
+        # The next request is shown from the event loop
+        self.app.processEvents()
+        self.assertTrue(self.dialog.isVisible())
+        self.assertIn("second.txt", self.dialog._message_label.text())
+
+        self.dialog.reject()
+        self.assertEqual(answers, [("first", True), ("second", False)])
+        self.assertEqual(len(file_transfer_dialog._pending_requests), 0)
+
+    def test_answer_without_callback_moves_on(self):
+        """Test a request without a callback still advances the queue."""
+        answers = []
+        FileTransferDialog.ask("first.txt", "alice")
+        FileTransferDialog.ask("second.txt", "bob", on_answer=answers.append)
+
+        self.dialog.reject()
+        self.app.processEvents()
+        self.dialog.accept()
+        self.assertEqual(answers, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
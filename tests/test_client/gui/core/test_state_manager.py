@@ -0,0 +1,277 @@
+# tests/test_client/gui/core/test_state_manager.py
+"""
+Unit tests for StateManager locking using unittest.
+"""
+
+import unittest
+import sys
+import os
+import threading
+import time
+
+# Adjust import path if needed
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from src.client.gui.core.state_manager import StateManager, _RWLock
+
+# Seconds to wait before treating a thread as blocked or deadlocked
+TIMEOUT = 5.0
+BLOCKED = 0.1
+
+
+def start_thread(target, *args) -> threading.Thread:
+    """Run a target on a daemon thread so a deadlock cannot hang the run."""
+    thread = threading.Thread(target=target, args=args, daemon=True)
+    thread.start()
+    return thread
+
+
+def keys_in_different_shards(manager: StateManager, count: int = 2) -> list:
+    """Find keys that live in distinct shards."""
+    keys, shards = [], []
+    for i in range(1000):
+        key = f"key.{i}"
+        shard = manager._shard(key)
+        if all(shard is not s for s in shards):
+            keys.append(key)
+            shards.append(shard)
+            if len(keys) == count:
+                return keys
+    raise AssertionError("Could not find keys in different shards")
+
+
+def other_key_in_shard(manager: StateManager, key: str) -> str:
+    """Find another key that lives in the same shard as a key."""
+    shard = manager._shard(key)
+    for i in range(1000):
+        other = f"{key}.{i}"
+        if manager._shard(other) is shard:
+            return other
+    raise AssertionError(f"Could not find a key sharing a shard with {key}")
+
+
+class TestRWLock(unittest.TestCase):
+    """Unit tests for the reader-writer lock."""
+
+    def setUp(self):
+        self.lock = _RWLock()
+
+    def assertFinishes(self, thread: threading.Thread):
+        thread.join(TIMEOUT)
+        self.assertFalse(thread.is_alive(), "thread deadlocked")
+
+    def assertBlocked(self, thread: threading.Thread):
+        thread.join(BLOCKED)
+        self.assertTrue(thread.is_alive(), "thread was not blocked")
+
+    def test_concurrent_readers(self):
+        """Test a second reader gets in while the first holds the lock."""
+        entered = threading.Event()
+
+        def read():
+            with self.lock.read_lock:
+                entered.set()
+
+        with self.lock.read_lock:
+            self.assertFinishes(start_thread(read))
+        self.assertTrue(entered.is_set())
+
+    def test_writer_excludes_readers_and_writers(self):
+        """Test readers and other writers wait for a writer."""
+        events = []
+
+        def read():
+            with self.lock.read_lock:
+                events.append("read")
+
+        def write():
+            with self.lock.write_lock:
+                events.append("write")
+
+        with self.lock.write_lock:
+            reader = start_thread(read)
+            writer = start_thread(write)
+            self.assertBlocked(reader)
+            self.assertBlocked(writer)
+            self.assertEqual(events, [])
+
+        self.assertFinishes(reader)
+        self.assertFinishes(writer)
+        self.assertCountEqual(events, ["read", "write"])
+
+    def test_readers_exclude_writers(self):
+        """Test a writer waits until every reader has left."""
+        with self.lock.read_lock:
+            writer = start_thread(self._write_once)
+            self.assertBlocked(writer)
+        self.assertFinishes(writer)
+
+    def test_writing_thread_reenters(self):
+        """Test the writing thread can read and write again."""
+        def nested():
+            with self.lock.write_lock:
+                with self.lock.read_lock:
+                    with self.lock.write_lock:
+                        pass
+                with self.lock.read_lock:
+                    pass
+
+        self.assertFinishes(start_thread(nested))
+        # Fully released afterwards
+        self.assertFinishes(start_thread(self._write_once))
+
+    def test_waiting_writer_is_not_starved(self):
+        """Test new readers queue behind a waiting writer."""
+        events = []
+
+        def write():
+            with self.lock.write_lock:
+                events.append("write")
+
+        def read():
+            with self.lock.read_lock:
+                events.append("read")
+
+        with self.lock.read_lock:
+            writer = start_thread(write)
+            self.assertBlocked(writer)
+            late_reader = start_thread(read)
+            self.assertBlocked(late_reader)
+
+        self.assertFinishes(writer)
+        self.assertFinishes(late_reader)
+        self.assertEqual(events, ["write", "read"])
+
+    def test_nested_read_while_writer_waits(self):
+        """Test a reading thread can read again while a writer waits."""
+        release = threading.Event()
+
+        def read_twice():
+            with self.lock.read_lock:
+                release.wait(TIMEOUT)
+                with self.lock.read_lock:
+                    pass
+
+        reader = start_thread(read_twice)
+        time.sleep(BLOCKED)
+        writer = start_thread(self._write_once)
+        self.assertBlocked(writer)
+        release.set()
+        self.assertFinishes(reader)
+        self.assertFinishes(writer)
+
+    def test_upgrade_raises(self):
+        """Test taking the write side while reading raises instead of deadlocking."""
+        raised = []
+
+        def upgrade():
+            with self.lock.read_lock:
+                try:
+                    self.lock.acquire_write()
+                except RuntimeError:
+                    raised.append(True)
+
+        self.assertFinishes(start_thread(upgrade))
+        self.assertEqual(raised, [True])
+        self.assertFinishes(start_thread(self._write_once))
+
+    def _write_once(self):
+        with self.lock.write_lock:
+            pass
+
+
+class TestStateManagerLocking(unittest.TestCase):
+    """Unit tests for StateManager under concurrent use."""
+
+    def setUp(self):
+        self.manager = StateManager()
+
+    def assertFinishes(self, *threads: threading.Thread):
+        for thread in threads:
+            thread.join(TIMEOUT)
+            self.assertFalse(thread.is_alive(), "thread deadlocked")
+
+    def test_get_state_inside_write(self):
+        """Test reading a key while its shard is write-locked by the same thread."""
+        self.manager.set_state("user.current", "alice")
+        seen = []
+
+        def read_inside_write():
+            with self.manager._shard("user.current").lock.write_lock:
+                seen.append(self.manager.get_state("user.current"))
+
+        self.assertFinishes(start_thread(read_inside_write))
+        self.assertEqual(seen, ["alice"])
+
+    def test_subscribers_read_new_state(self):
+        """Test subscribers can read state back during set/update/clear."""
+        seen = []
+        self.manager.subscribe_to_state(
+            "user.current", lambda change: seen.append(self.manager.get_state("user.current"))
+        )
+
+        def run():
+            self.manager.set_state("user.current", "alice")
+            self.manager.update_state({"user.current": "bob", "user.selected": "carol"})
+            self.manager.clear_state(["user.current"])
+
+        self.assertFinishes(start_thread(run))
+        self.assertEqual(seen, ["alice", "bob", None])
+
+    def test_cross_shard_subscribers(self):
+        """Test writers whose subscribers write each other's shards don't deadlock."""
+        first, second = keys_in_different_shards(self.manager)
+        # Each subscriber writes into the shard the other thread is writing
+        first_copy = other_key_in_shard(self.manager, second)
+        second_copy = other_key_in_shard(self.manager, first)
+        self.manager.subscribe_to_state(
+            first, lambda change: self.manager.set_state(first_copy, change.new_value)
+        )
+        self.manager.subscribe_to_state(
+            second, lambda change: self.manager.update_state({second_copy: change.new_value})
+        )
+
+        def write(key, count=500):
+            for i in range(count):
+                self.manager.set_state(key, i)
+                self.manager.update_state({key: -i - 1, "unrelated": i})
+                self.manager.clear_state([key])
+
+        self.assertFinishes(start_thread(write, first), start_thread(write, second))
+        self.assertIsNone(self.manager.get_state(first))
+        # The last notifications came from clearing each key
+        self.assertIsNone(self.manager.get_state(first_copy))
+        self.assertIsNone(self.manager.get_state(second_copy))
+
+    def test_clear_all_with_cross_shard_subscribers(self):
+        """Test clearing everything while subscribers write other keys."""
+        first, second = keys_in_different_shards(self.manager)
+        self.manager.update_state({first: 1, second: 2})
+        self.manager.subscribe_to_state(first, lambda change: self.manager.set_state(second, "again"))
+
+        self.assertFinishes(start_thread(self.manager.clear_state))
+        self.assertIsNone(self.manager.get_state(first))
+        self.assertEqual(self.manager.get_state(second), "again")
+
+    def test_concurrent_full_state_reads(self):
+        """Test full-state copies stay consistent while other keys are written."""
+        keys = keys_in_different_shards(self.manager, 4)
+
+        def write(key):
+            for i in range(300):
+                self.manager.set_state(key, [i])
+
+        bad_values = []
+
+        def read():
+            for _ in range(100):
+                state = self.manager.get_full_state()
+                bad_values.extend(value for value in state.values() if not isinstance(value, list))
+
+        threads = [start_thread(write, key) for key in keys] + [start_thread(read) for _ in range(2)]
+        self.assertFinishes(*threads)
+        self.assertEqual(bad_values, [])
+        self.assertEqual(self.manager.get_full_state(), {key: [299] for key in keys})
+
+
+if __name__ == '__main__':
+    unittest.main()
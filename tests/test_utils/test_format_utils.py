@@ -0,0 +1,64 @@
+# tests/test_utils/test_format_utils.py
+"""
+Unit tests for format_utils using unittest.
+"""
+
+import random
+import unittest
+
+from src.utils.format_utils import format_file_size
+
+
+def _reference_file_size(n):
+    """The unit loop format_file_size replaced."""
+    try:
+        n = int(n)
+    except Exception:
+        return ''
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if n < 1024.0:
+            return f"{n:.1f}{unit}"
+        n /= 1024.0
+    return f"{n:.1f}TB"
+
+
+class TestFormatFileSize(unittest.TestCase):
+    """Unit tests for format_file_size."""
+
+    def test_unit_boundaries(self):
+        """Test sizes on either side of each unit boundary."""
+        self.assertEqual(format_file_size(0), '0.0B')
+        self.assertEqual(format_file_size(1023), '1023.0B')
+        self.assertEqual(format_file_size(1024), '1.0KB')
+        self.assertEqual(format_file_size(1048575), '1024.0KB')
+        self.assertEqual(format_file_size(1 << 20), '1.0MB')
+        self.assertEqual(format_file_size(1 << 30), '1.0GB')
+        self.assertEqual(format_file_size(1 << 40), '1.0TB')
+
+    def test_above_terabytes(self):
+        """Test sizes past the largest unit stay in TB."""
+        self.assertEqual(format_file_size(1 << 50), '1024.0TB')
+        self.assertEqual(format_file_size(5 << 60), '5242880.0TB')
+
+    def test_numeric_strings_and_floats(self):
+        """Test values are converted like int() does."""
+        self.assertEqual(format_file_size('2048'), '2.0KB')
+        self.assertEqual(format_file_size(1536.9), '1.5KB')
+
+    def test_non_numeric_input(self):
+        """Test non-numeric sizes format as an empty string."""
+        self.assertEqual(format_file_size(None), '')
+        self.assertEqual(format_file_size('big'), '')
+        self.assertEqual(format_file_size([]), '')
+
+    def test_matches_reference_loop(self):
+        """Test output is identical to the loop it replaced."""
+        rng = random.Random(1234)
+        values = [(1 << bits) + delta for bits in range(64) for delta in (-1, 0, 1)]
+        values += [rng.randrange(-(1 << 50), 1 << 60) for _ in range(2000)]
+        for value in values:
+            self.assertEqual(format_file_size(value), _reference_file_size(value), value)
+
+
+if __name__ == '__main__':
+    unittest.main()